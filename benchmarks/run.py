@@ -0,0 +1,255 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+
+from contextlib import redirect_stdout
+from timeit import Timer
+
+from ..task1.solution import strict
+from ..task3.bench_solution import LESSON_DURATION, generate_person_intervals
+from ..task3.solution import appearance
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'task2', 'fixtures')
+REPEAT = 5
+THRESHOLD = 0.10  # допустимое замедление относительно baseline
+APPEARANCE_SIZES = (1, 10, 100, 1000)  # интервалов на человека
+COUNT_PAGES = 100  # task2.count_names считает имена со стольких копий страницы API
+
+def measure(func, repeat: int = REPEAT) -> float:
+    """Returns the best time of one `func()` call, in seconds.
+
+    :param func: Zero-argument callable to measure.
+    :type func: `Callable`
+    :param repeat: Number of timing runs, each about 0.2 s long.
+    :type repeat: `int`
+    :rtype: `float`
+    """
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def import_time(statement: str, repeat: int = REPEAT) -> float:
+    """Runs `statement` in a fresh interpreter with `-X importtime` and returns
+    the best total import time (sum of `self` column), in seconds.
+
+    :param statement: Python code, `{root}` is replaced with the top-level package name.
+    :type statement: `str`
+    :param repeat: Number of interpreter runs.
+    :type repeat: `int`
+    :rtype: `float`
+    :raises subprocess.CalledProcessError: If `statement` fails, e.g. a dependency is missing.
+    """
+    root = __package__.rsplit('.', 1)[0]
+    parent = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    command = [sys.executable, '-X', 'importtime', '-c', statement.format(root=root)]
+
+    best_us = None
+    for _ in range(repeat):
+        process = subprocess.run(command, capture_output=True, text=True, cwd=parent, check=True)
+        total_us = sum(
+            int(line.split('|')[0].split(':')[1])
+            for line in process.stderr.splitlines()
+            if line.startswith('import time:') and 'self [us]' not in line
+        )
+        best_us = total_us if best_us is None else min(best_us, total_us)
+    return best_us / 1_000_000
+
+def startup_cases() -> dict:
+    return {
+        'task2.import_cli': 'import {root}.task2.cli',
+        'task2.import_cli_api': 'import {root}.task2.cli as cli; cli.load_source("api")',
+        'task2.import_cli_html': 'import {root}.task2.cli as cli; cli.load_source("html")',
+    }
+
+def task1_cases() -> dict:
+    def plain(a: int, b: int) -> int:
+        return a + b
+
+    decorated = strict(plain)
+    return {
+        'task1.plain_call': lambda: plain(1, 2),
+        'task1.strict_call_args': lambda: decorated(1, 2),
+        'task1.strict_call_kwargs': lambda: decorated(a=1, b=2),
+    }
+
+def task3_cases() -> dict:
+    rng = random.Random(34)
+    cases = {}
+    for size in APPEARANCE_SIZES:
+        lesson_start = 1594663200
+        intervals = {
+            'lesson': [lesson_start, lesson_start + LESSON_DURATION],
+            'pupil': generate_person_intervals(rng, lesson_start, size),
+            'tutor': generate_person_intervals(rng, lesson_start, size)
+        }
+        cases[f'task3.appearance_{size}'] = lambda intervals=intervals: appearance(intervals)
+    return cases
+
+def task2_cases() -> dict:
+    # task2 зависит от requests и bs4, без них эти замеры пропускаются
+    try:
+        from bs4 import BeautifulSoup
+
+        from ..task2 import solution_api, solution_html_parse
+    except ImportError as e:
+        print(f'task2 benchmarks skipped: {e}', file=sys.stderr)
+        return {}
+
+    with open(os.path.join(FIXTURES_DIR, 'categorymembers_v2.json'), 'rb') as f:
+        api_page = f.read()
+    with open(os.path.join(FIXTURES_DIR, 'category_page.html'), encoding='utf-8') as f:
+        html_page = f.read()
+
+    def parse_api():
+        names = []
+        solution_api.add_ru_names(names, solution_api.json_loads(api_page))
+        return names
+
+    def parse_html():
+        names = []
+        soup = BeautifulSoup(html_page, 'html.parser')
+        solution_html_parse.add_ru_names(names, soup)
+        solution_html_parse.get_next_page_url(soup)
+        return names
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        names = parse_api() * COUNT_PAGES
+
+    def count():
+        return solution_api.count_by_chars(solution_api.get_first_chars(names))
+
+    return {
+        'task2.parse_api_page': parse_api,
+        'task2.parse_html_page': parse_html,
+        'task2.count_names': count,  # имя не зависит от размера фикстуры, иначе baseline теряет замер
+    }
+
+def run(name_filter: str | None = None) -> dict[str, float]:
+    """Runs all benchmarks, names containing `name_filter` only if passed.
+    Startup benchmarks measure import time of a fresh interpreter with `-X importtime`.
+
+    :return: Seconds per call for each benchmark.
+    :rtype: `dict`
+    """
+    cases = {**task1_cases(), **task2_cases(), **task3_cases()}
+    results = {}
+    with open(os.devnull, 'w') as devnull:
+        for name, func in cases.items():
+            if name_filter and name_filter not in name:
+                continue
+            with redirect_stdout(devnull):  # add_ru_names печатает каждое имя
+                results[name] = measure(func)
+            print(f'{name:<32} {results[name] * 1e6:>12.3f} us')
+
+    for name, statement in startup_cases().items():
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            results[name] = import_time(statement)
+        except subprocess.CalledProcessError as e:
+            print(f'{name} skipped: {e.stderr.strip().splitlines()[-1]}', file=sys.stderr)
+            continue
+        print(f'{name:<32} {results[name] * 1e6:>12.3f} us')
+
+    return results
+
+def save_baseline(path: str, results: dict[str, float]) -> None:
+    """Writes results with interpreter and platform info to a JSON file."""
+    baseline = {
+        'meta': {'python': platform.python_version(), 'platform': platform.platform()},
+        'results': results
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=4)
+
+def load_baseline(path: str) -> dict[str, float]:
+    """Reads results written by `save_baseline`."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+def compare(
+        baseline: dict[str, float],
+        results: dict[str, float],
+        threshold: float = THRESHOLD
+        ) -> list[tuple[str, float]]:
+    """Finds benchmarks slower than baseline by more than `threshold`.
+
+    :param baseline: Seconds per call from the baseline file.
+    :type baseline: `dict`
+    :param results: Seconds per call of the current run.
+    :type results: `dict`
+    :param threshold: Allowed slowdown, 0.1 means 10%.
+    :type threshold: `float`
+    :return: (name, current/baseline ratio) pairs of regressed benchmarks.
+    :rtype: `list`
+    """
+    regressions = []
+    for name, seconds in results.items():
+        if name not in baseline:
+            continue
+        ratio = seconds / baseline[name]
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+def find_missing(
+        baseline: dict[str, float],
+        results: dict[str, float],
+        name_filter: str | None = None
+        ) -> list[str]:
+    """Finds baseline benchmarks absent from the current run, e.g. skipped
+    because of a missing dependency or renamed. Names excluded by `name_filter` are not reported.
+
+    :param baseline: Seconds per call from the baseline file.
+    :type baseline: `dict`
+    :param results: Seconds per call of the current run.
+    :type results: `dict`
+    :param name_filter: Filter the current run was started with.
+    :type name_filter: `str`, `None`
+    :return: Missing benchmark names.
+    :rtype: `list`
+    """
+    return [
+        name for name in baseline
+        if name not in results and (not name_filter or name_filter in name)
+    ]
+
+def main():
+    """Benchmark runner for all tasks.
+
+    Usage:
+        python -m tetrika.benchmarks.run --save baseline.json
+        python -m tetrika.benchmarks.run --compare baseline.json --threshold 0.1
+    Exits with code 1 if any benchmark regressed beyond the threshold
+    or a baseline benchmark did not run.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument('--save', metavar='PATH', help='store results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare results with a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    parser.add_argument('--filter', dest='name_filter', help='run only benchmarks containing this text')
+    args = parser.parse_args()
+
+    results = run(args.name_filter)
+
+    if args.save:
+        save_baseline(args.save, results)
+
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        regressions = compare(baseline, results, args.threshold)
+        missing = find_missing(baseline, results, args.name_filter)
+        for name, ratio in regressions:
+            print(f'REGRESSION {name}: {ratio:.2f}x baseline')
+        for name in missing:
+            print(f'MISSING {name}: in baseline, but not in this run')
+        if regressions or missing:
+            sys.exit(1)
+        print(f'No regressions beyond {args.threshold:.0%}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import pytest
+
+from ..benchmarks.run import compare, find_missing, load_baseline, measure, save_baseline
+
+class TestMeasure:
+    def test_measure_returns_time_per_call(self):
+        assert 0 < measure(lambda: None, repeat=1) < 0.01
+
+class TestBaseline:
+    def test_save_and_load_baseline(self, tmp_path):
+        path = str(tmp_path / 'baseline.json')
+        save_baseline(path, {'task1.plain_call': 1e-7})
+        assert load_baseline(path) == {'task1.plain_call': 1e-7}
+
+class TestCompare:
+    def test_compare_flags_regression_beyond_threshold(self):
+        baseline = {'fast': 1.0, 'slow': 1.0}
+        results = {'fast': 1.05, 'slow': 1.5}
+        assert compare(baseline, results, threshold=0.1) == [('slow', 1.5)]
+
+    def test_compare_ignores_new_benchmarks(self):
+        assert compare({}, {'new': 1.0}) == []
+
+class TestFindMissing:
+    def test_find_missing_reports_skipped_benchmarks(self):
+        baseline = {'task1.plain_call': 1.0, 'task2.count_names': 1.0}
+        assert find_missing(baseline, {'task1.plain_call': 1.0}) == ['task2.count_names']
+
+    def test_find_missing_skips_filtered_out_benchmarks(self):
+        baseline = {'task1.plain_call': 1.0, 'task2.count_names': 1.0}
+        assert find_missing(baseline, {'task1.plain_call': 1.0}, name_filter='task1') == []
+        assert find_missing(baseline, {}, name_filter='task2') == ['task2.count_names']
+
+if __name__ == '__main__':
+    pytest.main()
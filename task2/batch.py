@@ -0,0 +1,158 @@
+import argparse
+import json
+import sys
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+from urllib.parse import quote
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from . import transport
+from .constants import (
+    API,
+    BATCH_FILENAME_PREFIX,
+    BATCH_WORKERS,
+    DEFAULT_JOBS,
+    SCRIPT_PATH,
+    START_PARAMS,
+
+    BATCH_FAILED_TEXT,
+    BATCH_JOB_FAILED_TEXT,
+    DUPLICATE_JOB_TEXT,
+    EMPTY_JOB_TEXT,
+    INCOMPLETE_JOB_TEXT
+)
+from .solution_api import build_url, count_by_chars, crawl_names, get_first_chars
+from .writers import ResultWriter, writer_from_env
+
+class CrawlError(Exception):
+    """Raised when a job crawl stopped before the last page or found nothing."""
+
+class Job(NamedTuple):
+    """One category of one wiki to be counted by first letters."""
+    base_url: str
+    category: str
+    alphabet: str
+
+def build_job_url(job: Job) -> str:
+    """Constructs the first page API URL for the job category.
+
+    :param job: Batch job.
+    :type job: `Job`
+    :return: A fully constructed URL ready for use in a web request.
+    :rtype: `str`
+    """
+    params = {**START_PARAMS, 'cmtitle': quote(job.category)}
+    return build_url(job.base_url, SCRIPT_PATH, API, params)
+
+def run_job(job: Job) -> Counter[str, int]:
+    """Collects names of the job category and counts them by first letters.
+
+    :param job: Batch job.
+    :type job: `Job`
+    :return: Counter object where keys are first letters and values are their counts.
+    :rtype: `Counter`
+    :raises CrawlError: If some page could not be fetched or no names were found
+        (the API returns an empty list for a category that does not exist).
+    """
+    names, completed = crawl_names(build_job_url(job), job.alphabet)
+    if not completed:
+        raise CrawlError(INCOMPLETE_JOB_TEXT.format(count=len(names)))
+    if not names:
+        raise CrawlError(EMPTY_JOB_TEXT)
+    return count_by_chars(get_first_chars(names))
+
+def run_batch(jobs: list[Job], max_workers: int = BATCH_WORKERS) -> dict[Job, Counter[str, int]]:
+    """Runs the jobs concurrently over a shared connection pool.
+    No more than `max_workers` requests are in flight at once, so total wall time
+    is bounded by the slowest category instead of the sum of all of them.
+
+    :param jobs: Batch jobs. A job listed more than once is reported and runs once.
+    :type jobs: `list`
+    :param max_workers: Global concurrency limit.
+    :type max_workers: `int`
+    :return: Letter counts for each job. Failed jobs (see `run_job`) are printed and left out.
+    :rtype: `dict`
+    """
+    for job, count in Counter(jobs).items():
+        if count > 1:  # результаты хранятся по job, второй прогон все равно был бы потерян
+            print(DUPLICATE_JOB_TEXT.format(job=job))
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    results = {}
+    with session, transport.use_transport(transport.transport_from_env(session)):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {job: executor.submit(run_job, job) for job in dict.fromkeys(jobs)}
+            for job, future in futures.items():
+                try:
+                    results[job] = future.result()
+                except Exception as e:  # одна упавшая категория не должна ронять весь батч
+                    print(BATCH_JOB_FAILED_TEXT.format(job=job, exception=e))
+
+    return results
+
+def load_jobs(path: str) -> list[Job]:
+    """Loads jobs from a JSON file.
+
+    Expected structure:
+    [
+        {"base_url": str, "category": str, "alphabet": str},
+    ]
+
+    :param path: JSON file path.
+    :type path: `str`
+    :return: Batch jobs.
+    :rtype: `list`
+    """
+    with open(path, encoding='utf-8') as f:
+        return [Job(**job) for job in json.load(f)]
+
+def save_batch(results: dict[Job, Counter[str, int]], writer: ResultWriter | None = None) -> str:
+    """Saves all jobs results into one file, each job letters in its alphabet order.
+    Rows are prefixed with the job `base_url` and `category`.
+
+    :param results: Letter counts for each job.
+    :type results: `dict`
+    :param writer: Result writer, the one chosen by `TASK2_WRITER` if not passed.
+    :type writer: `ResultWriter`, `None`
+    :return: Written file path.
+    :rtype: `str`
+    """
+    writer = writer or writer_from_env(BATCH_FILENAME_PREFIX)
+    return writer.write_groups(
+        ({'base_url': job.base_url, 'category': job.category}, data, job.alphabet)
+        for job, data in results.items()
+    )
+
+def main():
+    """Entry point for the batch script.
+
+    Usage: python -m tetrika.task2.batch [jobs.json] [--workers N]
+    Exits with code 1 if any job failed, results of the other jobs are still saved.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument('jobs', nargs='?')
+    parser.add_argument('--workers', type=int, default=BATCH_WORKERS)
+    args = parser.parse_args()
+
+    jobs = load_jobs(args.jobs) if args.jobs else [Job(*job) for job in DEFAULT_JOBS]
+    writer = writer_from_env(BATCH_FILENAME_PREFIX)  # до обхода: ошибка в имени не должна стоить всего батча
+    results = run_batch(jobs, args.workers)
+    if results:
+        save_batch(results, writer)
+
+    total = len(set(jobs))
+    if len(results) < total:
+        print(BATCH_FAILED_TEXT.format(failed=total - len(results), total=total), file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import argparse
+
+from time import perf_counter
+
+from . import solution_api, solution_html_parse, transport
+from .constants import API, BASE_URL, SCRIPT_PATH, START_PARAMS, START_URL
+
+SOURCES = {
+    'api': (solution_api, solution_api.build_url(BASE_URL, SCRIPT_PATH, API, START_PARAMS)),
+    'html': (solution_html_parse, START_URL)
+}
+
+def run(archive: str, source: str, latency: float = 0.0, repeat: int = 3) -> dict[str, float]:
+    """Replays a recorded crawl and measures `collect_data` wall time.
+
+    :param archive: Archive written in record mode.
+    :type archive: `str`
+    :param source: `api` or `html`.
+    :type source: `str`
+    :param latency: Simulated per-request latency, in seconds.
+    :type latency: `float`
+    :param repeat: Number of runs, best one is reported.
+    :type repeat: `int`
+    :return: Best wall time and number of collected names.
+    :rtype: `dict`
+    """
+    module, start_url = SOURCES[source]
+    timings = []
+    names = []
+    for _ in range(repeat):
+        with transport.use_transport(transport.ReplayTransport(archive, latency)):
+            started = perf_counter()
+            names = module.collect_data(start_url)
+            timings.append(perf_counter() - started)
+
+    return {'best_s': min(timings), 'names': len(names)}
+
+def main():
+    """Replays a crawl recorded with `TASK2_TRANSPORT=record` and prints timings.
+
+    Usage: python -m tetrika.task2.bench_crawl crawl.jsonl.gz --source api --latency 0.05
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument('archive')
+    parser.add_argument('--source', choices=SOURCES, default='api')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    result = run(args.archive, args.source, args.latency, args.repeat)
+    print(f'{args.source}: {result["names"]} names, best of {args.repeat}: {result["best_s"]:.3f} s')
+
+if __name__ == '__main__':
+    main()
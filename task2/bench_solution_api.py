@@ -0,0 +1,88 @@
+import gzip
+import json
+
+from pathlib import Path
+from timeit import repeat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+LEGACY_FIXTURE = 'categorymembers_v1.json'  # formatversion=1, pageid|ns|title
+MINIMAL_FIXTURE = 'categorymembers_v2.json'  # formatversion=2, cmprop=title|sortkeyprefix
+
+NUMBER = 200
+REPEAT = 5
+
+def load_fixture(name: str) -> bytes:
+    """Reads a recorded API response body as raw bytes.
+
+    :param name: Fixture file name inside `fixtures` directory.
+    :type name: `str`
+    :return: Response body as it was received.
+    :rtype: `bytes`
+    """
+    return (FIXTURES_DIR / name).read_bytes()
+
+def best_time_us(func, payload: bytes) -> float:
+    """Returns the best per-call time of `func(payload)` in microseconds.
+
+    :param func: Callable to measure.
+    :type func: `Callable`
+    :param payload: Argument passed to callable.
+    :type payload: `bytes`
+    :rtype: `float`
+    """
+    timings = repeat(lambda: func(payload), number=NUMBER, repeat=REPEAT)
+    return min(timings) / NUMBER * 1_000_000
+
+def decode_as_text(payload: bytes) -> dict:
+    """Old path: `response.encoding = 'utf-8'` + `response.json()`."""
+    return json.loads(payload.decode('utf-8'))
+
+def run() -> dict[str, dict[str, float]]:
+    """Measures per-page transfer size and decode time for both response shapes.
+
+    :return: Results keyed by fixture name.
+    :rtype: `dict`
+    """
+    decoders = {'text+json': decode_as_text, 'bytes+json': json.loads}
+    if orjson is not None:
+        decoders['bytes+orjson'] = orjson.loads
+
+    results = {}
+    for name in (LEGACY_FIXTURE, MINIMAL_FIXTURE):
+        payload = load_fixture(name)
+        result = {
+            'raw_bytes': len(payload),
+            'gzip_bytes': len(gzip.compress(payload)),
+        }
+        for decoder_name, decoder in decoders.items():
+            result[f'{decoder_name}_us'] = best_time_us(decoder, payload)
+        results[name] = result
+
+    return results
+
+def main():
+    """Prints per-page bytes and decode times, old request vs new one."""
+    results = run()
+    legacy, minimal = results[LEGACY_FIXTURE], results[MINIMAL_FIXTURE]
+
+    for name, result in results.items():
+        print(name)
+        for key, value in result.items():
+            print(f'    {key:<16} {value:>12.1f}')
+
+    # requests и так отправляет Accept-Encoding: gzip, deflate, поэтому сравниваем сжатые размеры
+    print(f'bytes on wire (gzip):     {legacy["gzip_bytes"]} -> {minimal["gzip_bytes"]} '
+          f'({minimal["gzip_bytes"] / legacy["gzip_bytes"]:.1%})')
+    print(f'decode, payload change:   {legacy["text+json_us"]:.1f} us -> {minimal["text+json_us"]:.1f} us '
+          f'({minimal["text+json_us"] / legacy["text+json_us"]:.1%})')
+    if 'bytes+orjson_us' in minimal:
+        print(f'decode, orjson vs json:   {minimal["bytes+json_us"]:.1f} us -> {minimal["bytes+orjson_us"]:.1f} us '
+              f'({minimal["bytes+orjson_us"] / minimal["bytes+json_us"]:.1%})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import argparse
+
+from importlib import import_module
+
+from .constants import MODE_RECORD, MODE_REPLAY, NEGATIVE_LATENCY_TEXT
+from .writers import WRITERS  # только стандартная библиотека, запуск остается ленивым
+
+# Модули источников импортируются только при выборе: API путь не тянет bs4
+SOURCES = {
+    'api': 'solution_api',
+    'html': 'solution_html_parse'
+}
+
+def load_source(source: str):
+    """Imports the backend module of the chosen source.
+
+    :param source: One of `SOURCES` keys.
+    :type source: `str`
+    :return: `solution_api` or `solution_html_parse` module.
+    """
+    return import_module(f'.{SOURCES[source]}', __package__)
+
+def non_negative_float(value: str) -> float:
+    """Argument type for `--latency`: `time.sleep` fails on a negative value in the middle of the crawl.
+
+    :raises argparse.ArgumentTypeError: If value is not a number or is negative.
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(NEGATIVE_LATENCY_TEXT.format(value=value))
+    if not number >= 0:  # заодно отсекает nan
+        raise argparse.ArgumentTypeError(NEGATIVE_LATENCY_TEXT.format(value=value))
+    return number
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Counts animals from ru.wikipedia by first letters.')
+    parser.add_argument('--source', choices=SOURCES, default='api')
+    parser.add_argument('--writer', choices=WRITERS, help='csv by default')
+    parser.add_argument('--transport', choices=(MODE_RECORD, MODE_REPLAY))
+    parser.add_argument('--archive', help='record/replay archive path')
+    parser.add_argument('--latency', type=non_negative_float, help='simulated replay latency, in seconds')
+    return parser.parse_args(argv)
+
+def main(argv: list[str] | None = None):
+    """Single entry point for both sources.
+    Flags are passed to the backend and override `TASK2_WRITER`, `TASK2_TRANSPORT`,
+    `TASK2_ARCHIVE` and `TASK2_REPLAY_LATENCY` without changing the environment.
+
+    Usage: python -m tetrika.task2 --source html --writer timeseries
+    """
+    args = parse_args(argv)
+    load_source(args.source).main(
+        writer=args.writer, mode=args.transport, archive=args.archive, latency=args.latency
+    )
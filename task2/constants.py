@@ -4,8 +4,21 @@ from urllib.parse import quote
 BASE_URL = 'https://ru.wikipedia.org'
 TITLE = quote('Категория:Животные_по_алфавиту')
 RU_ALPHABET = ('АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ')
+EN_ALPHABET = ('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
 TIMEOUT = 5
 
+# record/replay
+MODE_ENV = 'TASK2_TRANSPORT'
+ARCHIVE_ENV = 'TASK2_ARCHIVE'
+LATENCY_ENV = 'TASK2_REPLAY_LATENCY'
+MODE_RECORD = 'record'
+MODE_REPLAY = 'replay'
+
+MISSING_ARCHIVE_TEXT = 'Transport mode \'{mode}\' needs archive path in {env}'
+REPLAY_MISS_TEXT = 'No recorded response for url: {url}'
+NEGATIVE_LATENCY_TEXT = 'Latency must be a non-negative number of seconds, got \'{value}\''
+WRONG_MODE_TEXT = 'Unknown transport mode \'{mode}\', expected \'record\' or \'replay\''
+
 # API
 SCRIPT_PATH = 'w'
 API = 'api.php'
@@ -15,7 +28,21 @@ START_PARAMS = {
     'cmtitle': TITLE,
     'cmtype': 'page',
     'cmlimit': '500',
-    'format': 'json'
+    'cmprop': quote('title|sortkeyprefix'),
+    'format': 'json',
+    'formatversion': '2'
+}
+FULL_PARAMS = {  # полный обход для delta: время добавления нужно, чтобы не посчитать страницу дважды
+    **START_PARAMS,
+    'cmprop': quote('title|timestamp')
+}
+DELTA_PARAMS = {
+    **FULL_PARAMS,
+    'cmsort': 'timestamp',
+    'cmdir': 'newer'
+}
+REQUEST_HEADERS = {  # совпадает с заголовком requests по умолчанию, задан явно, чтобы не зависеть от него
+    'Accept-Encoding': 'gzip, deflate'
 }
 
 REQUEST_ERROR_TEXT = 'There was an error that occurred while handling request: {exception}'
@@ -24,6 +51,35 @@ WRONG_ARG_TYPE_TEXT = 'Argument \'{name}\': expected {expected} instance, \'{act
 WRONG_PARAM_TYPE_TEXT = 'Param key \'{key}\': expected {expected} instance as value, \'{actual}\' found'
 EXTRACTING_DATA_TEXT = 'There was an error occurred while extracting data: {exception}'
 
+# batch
+BATCH_WORKERS = 8
+BATCH_FILENAME_PREFIX = 'batch_'
+DEFAULT_JOBS = (
+    (BASE_URL, 'Категория:Животные_по_алфавиту', RU_ALPHABET),
+)
+BATCH_JOB_FAILED_TEXT = 'Job {job} failed: {exception}'
+BATCH_FAILED_TEXT = '{failed} of {total} jobs failed'
+DUPLICATE_JOB_TEXT = 'Job {job} is listed more than once, it runs once'
+INCOMPLETE_JOB_TEXT = 'crawl stopped on a failed request after {count} names'
+EMPTY_JOB_TEXT = 'no names found, category is empty or does not exist'
+
+# delta
+DELTA_STATE_FILE = 'delta_state.json'
+RECONCILE_INTERVAL = 24 * 60 * 60  # seconds between full crawls
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+CRAWL_FAILED_TEXT = 'Crawl failed, state in {path} is left unchanged'
+
+# writers
+WRITER_ENV = 'TASK2_WRITER'
+DEFAULT_WRITER = 'csv'
+CSV_FILENAME = 'result.csv'
+JSONL_FILENAME = 'result.jsonl'
+TIMESERIES_FILENAME = 'result_timeseries.csv'
+FILE_TIMESTAMP_FORMAT = '%Y_%m_%d_%H_%M_%S'
+
+WRONG_WRITER_TEXT = 'Unknown writer \'{name}\', expected one of: {expected}'
+
 # HTML parse
 REQUEST_PART = '/wiki/' + TITLE
 START_URL = BASE_URL + REQUEST_PART
@@ -0,0 +1,198 @@
+import json
+import os
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
+
+from . import transport
+from .constants import (
+    API,
+    BASE_URL,
+    DELTA_PARAMS,
+    DELTA_STATE_FILE,
+    FULL_PARAMS,
+    RECONCILE_INTERVAL,
+    RU_ALPHABET,
+    SCRIPT_PATH,
+    TIMESTAMP_FORMAT,
+
+    CRAWL_FAILED_TEXT
+)
+from .solution_api import build_url, count_by_chars, crawl_pages, get_first_chars
+from .writers import atomic_write, writer_from_env
+
+def load_state(path: str) -> dict | None:
+    """Reads the state of the previous run, if any.
+
+    Expected structure:
+    {
+        "timestamp": str,   # start of the last run, UTC: pages added before this second are counted
+        "reconciled": str,  # start of the last full crawl, UTC
+        "counts": {
+            str: int        # letter: count
+        },
+        "boundary": {
+            str: str        # title: timestamp of pages added at or after "timestamp", but already counted
+        }
+    }
+
+    :param path: State file path.
+    :type path: `str`
+    :return: State as a dict or None if there is no state yet.
+    :rtype: `dict`, `None`
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(path: str, state: dict) -> None:
+    """Writes the state of the current run.
+
+    :param path: State file path.
+    :type path: `str`
+    :param state: State, see `load_state`.
+    :type state: `dict`
+    """
+    atomic_write(path, json.dumps(state, ensure_ascii=False))
+
+def crawl_members(start_url: str) -> list[dict] | None:
+    """Collects category members (`title` and `timestamp` of each page) starting from `start_url`.
+
+    :param start_url: Initial URL with query parameters for category members.
+    :type start_url: `str`
+    :return: Members or None if some page could not be fetched.
+    :rtype: `list`, `None`
+    """
+    members = []
+    completed = crawl_pages(
+        start_url, lambda content: members.extend(content.get('query', {}).get('categorymembers') or [])
+    )
+    return members if completed else None
+
+def count_members(members: list[dict], alphabet: str = RU_ALPHABET) -> Counter[str, int]:
+    """Counts members whose titles start with `alphabet` letters by first letters.
+
+    :param members: Category members.
+    :type members: `list`
+    :param alphabet: Letters the names must start with.
+    :type alphabet: `str`
+    :rtype: `Counter`
+    """
+    names = [title.upper() for member in members if (title := member['title'])[0].upper() in alphabet]
+    return count_by_chars(get_first_chars(names)) or Counter()
+
+def full_crawl(now: datetime) -> dict | None:
+    """Pages through the whole category and builds a fresh state.
+    The crawl covers every page added before `now` and maybe some added while it runs.
+    The latter are kept in `boundary`, so the next delta does not count them again.
+
+    :param now: Start time of the run, UTC.
+    :type now: `datetime`
+    :return: New state or None if the crawl failed.
+    :rtype: `dict`, `None`
+    """
+    members = crawl_members(build_url(BASE_URL, SCRIPT_PATH, API, FULL_PARAMS))
+    if members is None:
+        return None
+    timestamp = now.strftime(TIMESTAMP_FORMAT)
+    boundary = {
+        member['title']: member['timestamp']
+        for member in members
+        if member.get('timestamp', '') >= timestamp  # строки одного формата сравниваются как время
+    }
+    return {
+        'timestamp': timestamp,
+        'reconciled': timestamp,
+        'counts': dict(count_members(members)),
+        'boundary': boundary
+    }
+
+def delta_crawl(state: dict, now: datetime) -> dict | None:
+    """Requests only the pages added to the category since the last run and patches the counts.
+    The window is [`state['timestamp']`, `now` - 1 s], both ends included by the API,
+    so consecutive windows do not overlap. Pages in `boundary` were counted by the full crawl.
+    Pages removed from the category are not seen here, they are fixed by the next full crawl.
+
+    :param state: State of the previous run.
+    :type state: `dict`
+    :param now: Start time of the run, UTC.
+    :type now: `datetime`
+    :return: Patched state or None if the crawl failed.
+    :rtype: `dict`, `None`
+    """
+    timestamp = now.strftime(TIMESTAMP_FORMAT)
+    end = (now.replace(microsecond=0) - timedelta(seconds=1)).strftime(TIMESTAMP_FORMAT)
+    if end < state['timestamp']:  # запуск в ту же секунду: окно пустое
+        return state
+
+    params = {**DELTA_PARAMS, 'cmstart': quote(state['timestamp']), 'cmend': quote(end)}
+    members = crawl_members(build_url(BASE_URL, SCRIPT_PATH, API, params))
+    if members is None:
+        return None
+
+    boundary = state.get('boundary', {})
+    counted = set(boundary.items())
+    added = count_members([m for m in members if (m['title'], m.get('timestamp')) not in counted])
+    counts = Counter(state['counts'])
+    counts.update(added)
+    return {
+        **state,
+        'timestamp': timestamp,
+        'counts': dict(counts),
+        'boundary': {title: added_at for title, added_at in boundary.items() if added_at >= timestamp}
+    }
+
+def is_reconcile_due(state: dict, now: datetime) -> bool:
+    """Checks whether the last full crawl is older than `RECONCILE_INTERVAL`.
+
+    :rtype: `bool`
+    """
+    reconciled = datetime.strptime(state['reconciled'], TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    return (now - reconciled).total_seconds() >= RECONCILE_INTERVAL
+
+def refresh(path: str = DELTA_STATE_FILE, now: datetime | None = None) -> Counter[str, int] | None:
+    """Brings stored counts up to date, with a delta crawl when possible.
+    A full crawl is done on the first run and every `RECONCILE_INTERVAL` seconds.
+    If the crawl fails, the stored state is left untouched, so the next run
+    requests the same time window again.
+
+    :param path: State file path.
+    :type path: `str`
+    :param now: Start time of the run, UTC. Current time if not passed.
+    :type now: `datetime`, `None`
+    :return: Up to date letter counts or None if the crawl failed.
+    :rtype: `Counter`, `None`
+    """
+    now = now or datetime.now(timezone.utc)
+    state = load_state(path)
+
+    if state is None or is_reconcile_due(state, now):
+        new_state = full_crawl(now)
+    else:
+        new_state = delta_crawl(state, now)
+
+    if new_state is None:
+        print(CRAWL_FAILED_TEXT.format(path=path))
+        return None
+
+    save_state(path, new_state)
+    return Counter(new_state['counts'])
+
+def main():
+    """Entry point for the delta script.
+
+    Performs the following steps:
+    1. Loads the counts of the previous run
+    2. Patches them with the pages added since then (or recounts everything if reconcile is due)
+    3. Saves results with the writer chosen by `TASK2_WRITER` (timestamped CSV file by default)
+    """
+    result_writer = writer_from_env()  # до обхода: ошибка в имени не должна сдвинуть состояние без записи результата
+    with transport.use_transport(transport.transport_from_env()):
+        result = refresh()
+    if result:
+        result_writer.write(result)
+
+if __name__ == '__main__':
+    main()
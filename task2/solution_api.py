@@ -1,15 +1,19 @@
-import csv
-import requests
-
 from collections import Counter
-from collections.abc import Sequence
-from datetime import datetime
+from collections.abc import Callable, Sequence
+
+from requests.exceptions import RequestException
 
-from requests.exceptions import RequestException, JSONDecodeError
+try:
+    from orjson import loads as json_loads  # быстрее стандартного json, но не обязателен
+except ImportError:
+    from json import loads as json_loads
 
+from . import transport
+from .writers import CSVWriter, writer_from_env
 from .constants import (
     API,
     BASE_URL,
+    REQUEST_HEADERS,
     RU_ALPHABET,
     SCRIPT_PATH,
     START_PARAMS,
@@ -55,10 +59,12 @@ def build_url(url: str, script_path: str, api: str, params: dict[str, str]) -> s
 
 def get_content(url: str) -> dict | None:
     """"Sends a GET request and returns the JSON-decoded content of a response, if any.
+    Compressed transfer is requested explicitly and the raw body bytes are decoded
+    straight to JSON (with `orjson` when installed).
 
-    Expected structure:
+    Expected structure (`formatversion=2`, `cmprop=title|sortkeyprefix`):
     {
-        "batchcomplete": str,
+        "batchcomplete": bool,
         "continue": {
             "cmcontinue": str,  # next page token
             "continue": str
@@ -66,9 +72,8 @@ def get_content(url: str) -> dict | None:
         "query": {
             "categorymembers": [
                 {
-                    "pageid": int,
-                    "ns": int,
-                    "title": str  # animal name
+                    "title": str,  # animal name
+                    "sortkeyprefix": str
                 },
             ]
         }
@@ -81,13 +86,12 @@ def get_content(url: str) -> dict | None:
     :raises TypeError: If `url` is of the wrong type.
     """
     try:
-        response = requests.get(url, timeout=TIMEOUT)
+        response = transport.get(url, headers=REQUEST_HEADERS, timeout=TIMEOUT)
         response.raise_for_status()
-        response.encoding = 'utf-8'
 
         try:
-            return response.json()
-        except JSONDecodeError as e:
+            return json_loads(response.content)
+        except ValueError as e:  # json.JSONDecodeError и orjson.JSONDecodeError наследуют ValueError
             print(JSON_ERROR_TEXT.format(exception=e))
             return None
 
@@ -95,47 +99,76 @@ def get_content(url: str) -> dict | None:
         print(REQUEST_ERROR_TEXT.format(exception=e))
         return None
 
-def collect_data(start_url: str) -> list[str]:
+def collect_data(start_url: str, alphabet: str = RU_ALPHABET) -> list[str]:
     """Collects Russian animal names from Wikipedia API.
     Performs paginated requests to extract all animal names 
-    that start with Cyrillic.
+    that start with Cyrillic (or any other given alphabet).
 
     :param start_url: Initial URL with query parameters for category members.
     :type start_url: `str`
+    :param alphabet: Letters the names must start with.
+    :type alphabet: `str`
     :return: List of animal names in Cyrillic alphabet.
     :rvalue: `list`
     """
+    ru_names, _ = crawl_names(start_url, alphabet)
+    return ru_names
+
+def crawl_names(start_url: str, alphabet: str = RU_ALPHABET) -> tuple[list[str], bool]:
+    """Same as `collect_data`, but also tells whether all pages were fetched.
+    A failed request, a non-JSON response or an API error stops the crawl with a partial list.
+
+    :param start_url: Initial URL with query parameters for category members.
+    :type start_url: `str`
+    :param alphabet: Letters the names must start with.
+    :type alphabet: `str`
+    :return: List of names and `True` if the crawl reached the last page.
+    :rvalue: `tuple`
+    """
     ru_names = []
+    completed = crawl_pages(start_url, lambda content: add_ru_names(ru_names, content, alphabet))
+    return ru_names, completed
+
+def crawl_pages(start_url: str, handle_page: Callable[[dict], None]) -> bool:
+    """Requests pages one by one, following continuation tokens, and passes each page to `handle_page`.
+
+    :param start_url: Initial URL with query parameters for category members.
+    :type start_url: `str`
+    :param handle_page: Called with the decoded content of each page.
+    :type handle_page: `Callable`
+    :return: `True` if the crawl reached the last page, `False` if a request failed.
+    :rvalue: `bool`
+    """
     current_url = start_url
 
     while True:
-        if content := get_content(current_url):
-            add_ru_names(ru_names, content)
-            next_page = get_next_page_token(content)
-            if next_page:
-                current_url = '&'.join((start_url, next_page))
-            else:
-                break
-        else:
-            break
+        content = get_content(current_url)
+        if content is None or 'error' in content:
+            return False
 
-    return ru_names
+        handle_page(content)
+        next_page = get_next_page_token(content)
+        if not next_page:
+            return True
+        current_url = '&'.join((start_url, next_page))
 
-def add_ru_names(data: list[str], content: dict) -> None:
+def add_ru_names(data: list[str], content: dict, alphabet: str = RU_ALPHABET) -> None:
     """Extracts and adds Russian animal names to the provided list.
-    Filters names starting with Russian letters and appends them to the target list.
+    Filters names starting with Russian letters (or any other given alphabet) and appends them to the target list.
 
     :param data: Target list.
     :ptype data: `list`
     :param content: A dictionary containing key-value pairs, including names as values.
     :type content: `dict`
+    :param alphabet: Letters the names must start with.
+    :type alphabet: `str`
     """
     try:
         category_members = content.get('query', {}).get('categorymembers')
         if category_members:
             for member in category_members:
                 name = member['title']
-                if name[0].upper() in RU_ALPHABET:
+                if name[0].upper() in alphabet:
                     data.append(name.upper())
                     print(name)
     except (TypeError) as e:
@@ -177,36 +210,39 @@ def count_by_chars(chars: list[str, int]) -> Counter | None:
     """
     return Counter(chars) if chars else None
 
-def save_to_csv(data: Counter[str, int], filename: str = 'result.csv') -> None:
+def save_to_csv(data: Counter[str, int], filename: str = 'result.csv', alphabet: str = RU_ALPHABET) -> None:
     """Saves data in alphabetical order to CSV file.
 
     :param data: Counter object where keys are unique characters and values are their counts.
     :type data: `Counter
+    :param alphabet: Letters order of the rows.
+    :type alphabet: `str`
     """
-    curr_datetime = datetime.now().strftime('%Y_%m_%d_%H_%M_%S')
-    file = '_'.join((curr_datetime, filename))
-
-    with open(file, 'w', encoding='utf-8') as f:
-        writer = csv.writer(f, lineterminator='\n')
-        for char in RU_ALPHABET:
-            if data.get(char):
-                writer.writerow((char, data.get(char)))
-
-def main():
+    CSVWriter(filename).write(data, alphabet)
+
+def main(
+        writer: str | None = None,
+        mode: str | None = None,
+        archive: str | None = None,
+        latency: float | None = None
+        ):
     """Entry point for the script.
+    Arguments (passed by `cli`) take precedence over `TASK2_*` environment variables.
     
     Performs the following steps:
     1. Collects Russian animal names from Wikipedia API
     2. Extracts first letters of each name
     3. Calculates letter frequencies
-    4. Saves results to a timestamped CSV file
+    4. Saves results with the writer chosen by `TASK2_WRITER` (timestamped CSV file by default)
     """
+    result_writer = writer_from_env(name=writer)  # до обхода: ошибка в имени не должна стоить всего обхода
     start_url = build_url(BASE_URL, SCRIPT_PATH, API, START_PARAMS)
-    names = collect_data(start_url)
+    with transport.use_transport(transport.transport_from_env(mode=mode, archive=archive, latency=latency)):
+        names = collect_data(start_url)
     if names:
         first_chars = get_first_chars(names)
         result = count_by_chars(first_chars)
-        save_to_csv(result)
+        result_writer.write(result)
 
 if __name__ == '__main__':
     main()
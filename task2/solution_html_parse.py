@@ -1,13 +1,11 @@
-import csv
-import requests
-
 from collections import Counter
 from collections.abc import Sequence
-from datetime import datetime
 
 from bs4 import BeautifulSoup
 from requests.exceptions import RequestException
 
+from . import transport
+from .writers import CSVWriter, writer_from_env
 from .constants import (
     BASE_URL,
     START_URL,
@@ -28,7 +26,7 @@ def get_content(url: str) -> str | None:
     """
     try:
         if url:
-            response = requests.get(url, timeout=TIMEOUT)
+            response = transport.get(url, timeout=TIMEOUT)
             response.raise_for_status()
             response.encoding = 'utf-8'
             return response.text
@@ -115,30 +113,31 @@ def save_to_csv(data: Counter[str, int], filename: str = 'result.csv') -> None:
     :param data: Counter object where keys are unique characters and values are their counts.
     :type data: `Counter
     """
-    curr_datetime = datetime.now().strftime('%Y_%m_%d_%H_%M_%S')
-    file = '_'.join((curr_datetime, filename))
-
-    with open(file, 'w', encoding='utf-8') as f:
-        writer = csv.writer(f, lineterminator='\n')
-        for char in RU_ALPHABET:
-            if data.get(char):
-                writer.writerow((char, data.get(char)))
-
-def main():
+    CSVWriter(filename).write(data, RU_ALPHABET)
+
+def main(
+        writer: str | None = None,
+        mode: str | None = None,
+        archive: str | None = None,
+        latency: float | None = None
+        ):
     """Entry point for the script.
+    Arguments (passed by `cli`) take precedence over `TASK2_*` environment variables.
     
     Performs the following steps:
     1. Collects Russian animal names from Wikipedia
     2. Extracts first letters of each name
     3. Calculates letter frequencies
-    4. Saves results to a timestamped CSV file
+    4. Saves results with the writer chosen by `TASK2_WRITER` (timestamped CSV file by default)
     """
+    result_writer = writer_from_env(name=writer)  # до обхода: ошибка в имени не должна стоить всего обхода
     start_url = START_URL
-    names = collect_data(start_url)  # Сначала получаем 'список всех животных' в соответствии с заданием
+    with transport.use_transport(transport.transport_from_env(mode=mode, archive=archive, latency=latency)):
+        names = collect_data(start_url)  # Сначала получаем 'список всех животных' в соответствии с заданием
     if names:
         first_chars = get_first_chars(names)  # Потом получаем список первых букв (можно было сразу получить список букв, отработало бы быстрее)
         result = count_by_chars(first_chars)
-        save_to_csv(result)
+        result_writer.write(result)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from ..task2 import batch
+from ..task2.batch import (
+    Counter,
+    Job,
+    build_job_url,
+    load_jobs,
+    main,
+    run_batch,
+    save_batch
+)
+from ..task2.constants import EN_ALPHABET, RU_ALPHABET
+from ..task2.transport import save_archive
+
+RU_JOB = Job('http://ru.test', 'Категория:Тест', RU_ALPHABET)
+EN_JOB = Job('http://en.test', 'Category:Test', EN_ALPHABET)
+
+@pytest.fixture
+def replay_env(monkeypatch, tmp_path):
+    path = str(tmp_path / 'crawl.jsonl.gz')
+    save_archive(path, {
+        build_job_url(RU_JOB): (
+            200, '{"query": {"categorymembers": [{"title": "Лев"}, {"title": "Лось"}, {"title": "Dog"}]}}'.encode('utf-8')
+        ),
+        build_job_url(EN_JOB): (
+            200, '{"query": {"categorymembers": [{"title": "Лев"}, {"title": "Dog"}]}}'.encode('utf-8')
+        )
+    })
+    monkeypatch.setenv('TASK2_TRANSPORT', 'replay')
+    monkeypatch.setenv('TASK2_ARCHIVE', path)
+
+class TestBuildJobURL:
+    def test_build_job_url(self):
+        result = build_job_url(EN_JOB)
+        assert result.startswith('http://en.test/w/api.php?')
+        assert 'cmtitle=Category%3ATest' in result
+
+class TestRunBatch:
+    def test_run_batch_uses_job_alphabets(self, replay_env):
+        result = run_batch([RU_JOB, EN_JOB], max_workers=2)
+        assert result == {RU_JOB: Counter({'Л': 2}), EN_JOB: Counter({'D': 1})}
+
+    def test_run_batch_skips_missing_category(self, replay_env, capsys):
+        job = Job('http://ru.test', 'Категория:Нет', RU_ALPHABET)
+        assert run_batch([RU_JOB, job]) == {RU_JOB: Counter({'Л': 2})}
+        assert 'Категория:Нет' in capsys.readouterr().out
+
+    def test_run_batch_skips_empty_category(self, replay_env, monkeypatch, tmp_path):
+        job = Job('http://ru.test', 'Категория:Пусто', RU_ALPHABET)
+        path = str(tmp_path / 'empty.jsonl.gz')
+        save_archive(path, {build_job_url(job): (200, b'{"query": {"categorymembers": []}}')})
+        monkeypatch.setenv('TASK2_ARCHIVE', path)
+
+        assert run_batch([job]) == {}
+
+    def test_run_batch_skips_partial_crawl(self, replay_env, monkeypatch, tmp_path):
+        path = str(tmp_path / 'partial.jsonl.gz')
+        save_archive(path, {build_job_url(RU_JOB): (
+            200, '{"continue": {"cmcontinue": "next"}, "query": {"categorymembers": [{"title": "Лев"}]}}'.encode('utf-8')
+        )})
+        monkeypatch.setenv('TASK2_ARCHIVE', path)
+
+        assert run_batch([RU_JOB]) == {}
+
+    def test_run_batch_runs_duplicate_job_once(self, replay_env, mocker, capsys):
+        spy_run_job = mocker.spy(batch, 'run_job')
+        assert run_batch([RU_JOB, RU_JOB]) == {RU_JOB: Counter({'Л': 2})}
+        spy_run_job.assert_called_once_with(RU_JOB)
+        assert 'more than once' in capsys.readouterr().out
+
+class TestMain:
+    def test_main_exits_with_error_on_failed_job(self, replay_env, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('TASK2_WRITER', raising=False)
+        jobs = tmp_path / 'jobs.json'
+        jobs.write_text(json.dumps([RU_JOB._asdict(), {**RU_JOB._asdict(), 'category': 'Категория:Нет'}]))
+        monkeypatch.setattr('sys.argv', ['batch', str(jobs)])
+
+        with pytest.raises(SystemExit) as e:
+            main()
+        assert e.value.code == 1
+        [file] = tmp_path.glob('*_batch_result.csv')
+        assert file.read_text(encoding='utf-8').splitlines() == ['http://ru.test,Категория:Тест,Л,2']
+
+class TestLoadJobs:
+    def test_load_jobs(self, tmp_path):
+        path = tmp_path / 'jobs.json'
+        path.write_text('[{"base_url": "http://en.test", "category": "Category:Test", "alphabet": "AB"}]')
+        assert load_jobs(str(path)) == [Job('http://en.test', 'Category:Test', 'AB')]
+
+class TestSaveBatch:
+    def test_save_batch_csv(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('TASK2_WRITER', raising=False)
+        save_batch({RU_JOB: Counter({'Л': 2, 'А': 1}), EN_JOB: Counter({'D': 1})})
+
+        [file] = tmp_path.glob('*_batch_result.csv')
+        assert file.read_text(encoding='utf-8').splitlines() == [
+            'http://ru.test,Категория:Тест,А,1',
+            'http://ru.test,Категория:Тест,Л,2',
+            'http://en.test,Category:Test,D,1'
+        ]
+
+    def test_save_batch_uses_env_writer(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv('TASK2_WRITER', 'jsonl')
+        path = save_batch({EN_JOB: Counter({'D': 1})})
+
+        assert path.endswith('_batch_result.jsonl')
+        assert (tmp_path / path).read_text(encoding='utf-8') == (
+            '{"base_url": "http://en.test", "category": "Category:Test", "letter": "D", "count": 1}\n'
+        )
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ..task2.cli import SOURCES, main
+
+ROOT = __package__.rsplit('.', 1)[0]
+ROOT_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def imported_modules(statement: str) -> set[str]:
+    command = [sys.executable, '-c', f'import sys; {statement}; print(*sys.modules)']
+    process = subprocess.run(command, capture_output=True, text=True, cwd=ROOT_PARENT, check=True)
+    return set(process.stdout.split())
+
+class TestLazyImports:
+    def test_cli_imports_no_backend(self):
+        modules = imported_modules(f'import {ROOT}.task2.cli')
+        assert 'requests' not in modules
+        assert 'bs4' not in modules
+
+    def test_api_source_does_not_import_bs4(self):
+        modules = imported_modules(f'import {ROOT}.task2.cli as cli; cli.load_source("api")')
+        assert 'requests' in modules
+        assert 'bs4' not in modules
+
+class TestMain:
+    @pytest.mark.parametrize('source', list(SOURCES))
+    def test_main_runs_chosen_source(self, mocker, source):
+        mock_load_source = mocker.patch('tetrika.task2.cli.load_source')
+        main(['--source', source])
+
+        mock_load_source.assert_called_once_with(source)
+        mock_load_source.return_value.main.assert_called_once_with(
+            writer=None, mode=None, archive=None, latency=None
+        )
+
+    def test_main_passes_flags_without_changing_env(self, mocker):
+        mock_load_source = mocker.patch('tetrika.task2.cli.load_source')
+        environ = dict(os.environ)
+
+        main(['--writer', 'jsonl', '--transport', 'replay', '--archive', 'crawl.jsonl.gz', '--latency', '0.5'])
+        mock_load_source.return_value.main.assert_called_once_with(
+            writer='jsonl', mode='replay', archive='crawl.jsonl.gz', latency=0.5
+        )
+        assert dict(os.environ) == environ
+
+    @pytest.mark.parametrize('argv', [
+        ['--latency', 'fast'],
+        ['--latency', '-1'],
+        ['--writer', 'parquet']
+    ])
+    def test_main_rejects_wrong_flags_before_crawl(self, mocker, argv):
+        mock_load_source = mocker.patch('tetrika.task2.cli.load_source')
+        with pytest.raises(SystemExit):
+            main(argv)
+        mock_load_source.assert_not_called()
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,137 @@
+import json
+
+import pytest
+
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+from ..task2.constants import API, BASE_URL, DELTA_PARAMS, FULL_PARAMS, SCRIPT_PATH
+from ..task2.delta import Counter, build_url, load_state, main, refresh, save_state
+from ..task2.transport import ReplayTransport, save_archive, use_transport
+
+def delta_url(start: str, end: str) -> str:
+    return build_url(BASE_URL, SCRIPT_PATH, API, {**DELTA_PARAMS, 'cmstart': quote(start), 'cmend': quote(end)})
+
+def page(*members: tuple[str, str]) -> tuple[int, bytes]:
+    return 200, json.dumps(
+        {'query': {'categorymembers': [{'title': title, 'timestamp': added_at} for title, added_at in members]}}
+    ).encode('utf-8')
+
+FULL_URL = build_url(BASE_URL, SCRIPT_PATH, API, FULL_PARAMS)
+DELTA_URL = delta_url('2026-01-01T10:00:00Z', '2026-01-01T10:59:59Z')
+
+@pytest.fixture
+def archive(tmp_path):
+    path = str(tmp_path / 'crawl.jsonl.gz')
+    save_archive(path, {
+        FULL_URL: (
+            200, '{"query": {"categorymembers": [{"title": "Лев"}, {"title": "Бобр"}, {"title": "Dog"}]}}'.encode('utf-8')
+        ),
+        DELTA_URL: (
+            200, '{"query": {"categorymembers": [{"title": "Лось", "timestamp": "2026-01-01T10:30:00Z"}]}}'.encode('utf-8')
+        )
+    })
+    return path
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / 'state.json')
+
+class TestRefresh:
+    def test_refresh_first_run_is_full(self, archive, state_file):
+        now = datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+        with use_transport(ReplayTransport(archive)):
+            result = refresh(state_file, now)
+
+        assert result == Counter({'Л': 1, 'Б': 1})
+        assert load_state(state_file) == {
+            'timestamp': '2026-01-01T10:00:00Z',
+            'reconciled': '2026-01-01T10:00:00Z',
+            'counts': {'Л': 1, 'Б': 1},
+            'boundary': {}
+        }
+
+    def test_refresh_patches_counts_with_delta(self, archive, state_file):
+        save_state(state_file, {
+            'timestamp': '2026-01-01T10:00:00Z',
+            'reconciled': '2026-01-01T10:00:00Z',
+            'counts': {'Л': 1, 'Б': 1}
+        })
+        now = datetime(2026, 1, 1, 11, tzinfo=timezone.utc)
+        with use_transport(ReplayTransport(archive)):
+            result = refresh(state_file, now)
+
+        assert result == Counter({'Л': 2, 'Б': 1})
+        assert load_state(state_file)['timestamp'] == '2026-01-01T11:00:00Z'
+        assert load_state(state_file)['reconciled'] == '2026-01-01T10:00:00Z'
+
+    def test_refresh_reconciles_when_due(self, archive, state_file):
+        save_state(state_file, {
+            'timestamp': '2026-01-01T10:00:00Z',
+            'reconciled': '2026-01-01T10:00:00Z',
+            'counts': {'Л': 100}
+        })
+        now = datetime(2026, 1, 2, 10, tzinfo=timezone.utc)
+        with use_transport(ReplayTransport(archive)):
+            result = refresh(state_file, now)
+
+        assert result == Counter({'Л': 1, 'Б': 1})
+        assert load_state(state_file)['reconciled'] == '2026-01-02T10:00:00Z'
+
+    def test_refresh_counts_boundary_page_once(self, tmp_path, state_file):
+        # Лось добавлен в секунду начала полного обхода: его вернут и полный обход, и следующее окно delta
+        path = str(tmp_path / 'crawl.jsonl.gz')
+        save_archive(path, {
+            FULL_URL: page(('Лев', '2025-12-01T00:00:00Z'), ('Лось', '2026-01-01T10:00:00Z')),
+            DELTA_URL: page(('Лось', '2026-01-01T10:00:00Z'), ('Бобр', '2026-01-01T10:30:00Z')),
+            delta_url('2026-01-01T11:00:00Z', '2026-01-01T11:59:59Z'): page(('Енот', '2026-01-01T11:00:00Z'))
+        })
+
+        with use_transport(ReplayTransport(path)):
+            assert refresh(state_file, datetime(2026, 1, 1, 10, tzinfo=timezone.utc)) == Counter({'Л': 2})
+            assert load_state(state_file)['boundary'] == {'Лось': '2026-01-01T10:00:00Z'}
+
+            assert refresh(state_file, datetime(2026, 1, 1, 11, tzinfo=timezone.utc)) == Counter({'Л': 2, 'Б': 1})
+            assert load_state(state_file)['boundary'] == {}
+
+            # следующее окно начинается сразу после cmend предыдущего
+            result = refresh(state_file, datetime(2026, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc))
+            assert result == Counter({'Л': 2, 'Б': 1, 'Е': 1})
+
+    def test_refresh_failed_delta_keeps_state(self, tmp_path, state_file):
+        state = {
+            'timestamp': '2026-01-01T10:00:00Z',
+            'reconciled': '2026-01-01T10:00:00Z',
+            'counts': {'Л': 1, 'Б': 1}
+        }
+        save_state(state_file, state)
+        empty_archive = str(tmp_path / 'empty.jsonl.gz')
+        save_archive(empty_archive, {})
+
+        now = datetime(2026, 1, 1, 11, tzinfo=timezone.utc)
+        with use_transport(ReplayTransport(empty_archive)):
+            assert refresh(state_file, now) is None
+
+        assert load_state(state_file) == state
+
+    def test_refresh_failed_full_crawl_saves_nothing(self, tmp_path, state_file):
+        empty_archive = str(tmp_path / 'empty.jsonl.gz')
+        save_archive(empty_archive, {})
+
+        now = datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+        with use_transport(ReplayTransport(empty_archive)):
+            assert refresh(state_file, now) is None
+
+        assert load_state(state_file) is None
+
+class TestMain:
+    def test_main_checks_writer_before_crawl(self, mocker, monkeypatch):
+        monkeypatch.setenv('TASK2_WRITER', 'parquet')
+        mock_refresh = mocker.patch('tetrika.task2.delta.refresh')
+
+        with pytest.raises(ValueError):
+            main()
+        mock_refresh.assert_not_called()
+
+if __name__ == '__main__':
+    pytest.main()
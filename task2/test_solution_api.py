@@ -4,10 +4,16 @@ from ..task2.solution_api import (
     Counter,
     add_ru_names,
     build_url,
+    collect_data,
+    crawl_names,
     count_by_chars,
+    get_content,
     get_first_chars,
-    get_next_page_token
+    get_next_page_token,
+    RequestException,
+    REQUEST_HEADERS
 )
+from ..task2.transport import ReplayTransport, save_archive, use_transport
 
 class TestBuildURL:
     def test_build_url(self):
@@ -18,9 +24,80 @@ class TestBuildURL:
         with pytest.raises(TypeError):
             build_url(123, 'w', 'apiv1', {'query': 'test'})
 
-# class TestGetContent: не смог написать тесты
-
-# class TestCollectData: не смог написать тесты
+class TestGetContent:
+    @pytest.mark.parametrize(
+        'content,expected',
+        [
+            ('{"query": {"categorymembers": [{"title": "Лев"}]}}'.encode('utf-8'),
+             {'query': {'categorymembers': [{'title': 'Лев'}]}}),
+            (b'<html>not json</html>', None)
+        ]
+    )
+    def test_get_content_decodes_bytes(self, mocker, content, expected):
+        mock_response = mocker.Mock()
+        mock_response.content = content
+        mock_response.raise_for_status.return_value = None
+        mocker.patch('tetrika.task2.transport.requests.get', return_value=mock_response)
+
+        assert get_content('http://test.url') == expected
+
+    def test_get_content_requests_compression(self, mocker):
+        mock_response = mocker.Mock()
+        mock_response.content = b'{}'
+        mock_get = mocker.patch('tetrika.task2.transport.requests.get', return_value=mock_response)
+
+        get_content('http://test.url')
+        assert mock_get.call_args.kwargs['headers'] == REQUEST_HEADERS
+
+    def test_get_content_request_error(self, mocker):
+        mock_response = mocker.Mock()
+        mock_response.raise_for_status.side_effect = RequestException('Error: 500')
+        mocker.patch('tetrika.task2.transport.requests.get', return_value=mock_response)
+
+        assert get_content('http://test.url') is None
+
+class TestCollectData:
+    def test_collect_data_replays_all_pages(self, tmp_path):
+        path = str(tmp_path / 'crawl.jsonl.gz')
+        save_archive(path, {
+            'http://test.url?list=test': (
+                200, '{"continue": {"cmcontinue": "next"}, "query": {"categorymembers": [{"title": "Лев"}]}}'.encode('utf-8')
+            ),
+            'http://test.url?list=test&cmcontinue=next': (
+                200, '{"query": {"categorymembers": [{"title": "Dog"}, {"title": "Медведь"}]}}'.encode('utf-8')
+            )
+        })
+
+        with use_transport(ReplayTransport(path)):
+            result = collect_data('http://test.url?list=test')
+
+        assert result == ['ЛЕВ', 'МЕДВЕДЬ']
+
+    def test_collect_data_stops_on_replay_miss(self, tmp_path):
+        path = str(tmp_path / 'crawl.jsonl.gz')
+        save_archive(path, {})
+
+        with use_transport(ReplayTransport(path)):
+            assert collect_data('http://test.url?list=test') == []
+
+class TestCrawlNames:
+    def test_crawl_names_reports_partial_crawl(self, tmp_path):
+        path = str(tmp_path / 'crawl.jsonl.gz')
+        save_archive(path, {
+            'http://test.url?list=test': (
+                200, '{"continue": {"cmcontinue": "next"}, "query": {"categorymembers": [{"title": "Лев"}]}}'.encode('utf-8')
+            )
+        })
+
+        with use_transport(ReplayTransport(path)):
+            assert crawl_names('http://test.url?list=test') == (['ЛЕВ'], False)
+
+    def test_crawl_names_api_error(self, tmp_path):
+        path = str(tmp_path / 'crawl.jsonl.gz')
+        save_archive(path, {'http://test.url?list=test': (200, b'{"error": {"code": "badvalue"}}')})
+
+        with use_transport(ReplayTransport(path)):
+            assert crawl_names('http://test.url?list=test') == ([], False)
 
 class TestAddRuNames:
     def test_add_ru_names_filter_ru_letters(self):
@@ -31,6 +108,13 @@ class TestAddRuNames:
         add_ru_names(result, content)
         assert sorted(result) == sorted(expected)
 
+    def test_add_ru_names_custom_alphabet(self):
+        result = []
+        content = {'query': {'categorymembers': [{'title': 'Лев'}, {'title': 'Dog'}]}}
+
+        add_ru_names(result, content, 'ABCD')
+        assert result == ['DOG']
+
     def test_add_ru_names_empty_collection(self):
         result = []
         expected = []
@@ -94,7 +94,7 @@ class TestGetContent:
                 f'Error: {status_code}'
             )
 
-        mocker.patch('tetrika.task2.solution_html_parse.requests.get', return_value=mock_response)
+        mocker.patch('tetrika.task2.transport.requests.get', return_value=mock_response)
 
         result = get_content('http://test.url')
         assert result == expected
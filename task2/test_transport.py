@@ -0,0 +1,100 @@
+import pytest
+
+from ..task2.transport import (
+    HTTPError,
+    RecordingTransport,
+    ReplayMissError,
+    ReplayTransport,
+    get,
+    load_archive,
+    save_archive,
+    transport_from_env,
+    use_transport
+)
+
+@pytest.fixture
+def archive(tmp_path):
+    path = str(tmp_path / 'crawl.jsonl.gz')
+    save_archive(path, {
+        'http://test.url/1': (200, 'Лев'.encode('utf-8')),
+        'http://test.url/2': (404, b'Not found')
+    })
+    return path
+
+class TestArchive:
+    def test_save_and_load_roundtrip(self, archive):
+        entries = load_archive(archive)
+        assert entries['http://test.url/1'] == (200, 'Лев'.encode('utf-8'))
+        assert entries['http://test.url/2'] == (404, b'Not found')
+
+    def test_non_utf8_body_roundtrip(self, tmp_path):
+        path = str(tmp_path / 'crawl.jsonl.gz')
+        body = 'Лев'.encode('cp1251') + b'\xff\x00'
+        save_archive(path, {'http://test.url': (200, body)})
+        assert load_archive(path) == {'http://test.url': (200, body)}
+
+class TestTransportFromEnv:
+    def test_transport_from_env_requires_archive(self, monkeypatch):
+        monkeypatch.setenv('TASK2_TRANSPORT', 'replay')
+        monkeypatch.delenv('TASK2_ARCHIVE', raising=False)
+
+        with pytest.raises(ValueError, match='TASK2_ARCHIVE'):
+            transport_from_env()
+
+    def test_transport_from_env_unknown_mode(self, monkeypatch):
+        monkeypatch.setenv('TASK2_TRANSPORT', 'proxy')
+        monkeypatch.setenv('TASK2_ARCHIVE', 'crawl.jsonl.gz')
+
+        with pytest.raises(ValueError):
+            transport_from_env()
+
+    def test_transport_from_env_arguments_override_env(self, monkeypatch, archive):
+        monkeypatch.setenv('TASK2_TRANSPORT', 'proxy')
+        monkeypatch.setenv('TASK2_REPLAY_LATENCY', '5')
+
+        replay = transport_from_env(mode='replay', archive=archive, latency=0.5)
+        assert isinstance(replay, ReplayTransport)
+        assert replay.latency == 0.5
+
+class TestRecordingTransport:
+    def test_recording_transport_saves_pairs(self, mocker, tmp_path):
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{}'
+        mocker.patch('tetrika.task2.transport.requests.get', return_value=mock_response)
+
+        path = str(tmp_path / 'crawl.jsonl.gz')
+        with use_transport(RecordingTransport(path)):
+            assert get('http://test.url') is mock_response
+
+        assert load_archive(path) == {'http://test.url': (200, b'{}')}
+
+class TestReplayTransport:
+    def test_replay_returns_recorded_response(self, archive):
+        with use_transport(ReplayTransport(archive)):
+            response = get('http://test.url/1', timeout=5)
+
+        response.raise_for_status()
+        assert response.text == 'Лев'
+
+    def test_replay_recorded_error_status(self, archive):
+        with use_transport(ReplayTransport(archive)):
+            response = get('http://test.url/2')
+
+        with pytest.raises(HTTPError):
+            response.raise_for_status()
+
+    def test_replay_miss(self, archive):
+        with use_transport(ReplayTransport(archive)):
+            with pytest.raises(ReplayMissError):
+                get('http://test.url/3')
+
+    def test_replay_latency(self, mocker, archive):
+        mock_sleep = mocker.patch('tetrika.task2.transport.time.sleep')
+        with use_transport(ReplayTransport(archive, latency=0.25)):
+            get('http://test.url/1')
+
+        mock_sleep.assert_called_once_with(0.25)
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,134 @@
+import os
+import stat
+
+import pytest
+
+from datetime import datetime, timezone
+
+from ..task2.writers import (
+    Counter,
+    CSVWriter,
+    JSONLinesWriter,
+    ResultWriter,
+    TimeSeriesWriter,
+    append_write,
+    atomic_write,
+    get_writer,
+    writer_from_env
+)
+
+RUN_AT = datetime(2026, 1, 1, 10, 30, tzinfo=timezone.utc)
+DATA = Counter({'Б': 2, 'А': 1, 'D': 5})
+
+@pytest.fixture(autouse=True)
+def workdir(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+class TestAtomicWrite:
+    def test_atomic_write_replaces(self, workdir):
+        atomic_write('out.txt', 'old')
+        atomic_write('out.txt', 'new')
+        assert (workdir / 'out.txt').read_text() == 'new'
+        assert [p.name for p in workdir.iterdir()] == ['out.txt']
+
+    def test_atomic_write_new_file_mode_follows_umask(self, workdir):
+        old_umask = os.umask(0o022)
+        try:
+            atomic_write('out.txt', 'new')
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE(os.stat(workdir / 'out.txt').st_mode) == 0o644
+
+    def test_atomic_write_does_not_change_umask(self, mocker, workdir):
+        mock_umask = mocker.patch('tetrika.task2.writers.os.umask')
+        atomic_write('out.txt', 'new')
+        mock_umask.assert_not_called()
+
+    def test_atomic_write_keeps_existing_mode(self, workdir):
+        atomic_write('out.txt', 'old')
+        os.chmod(workdir / 'out.txt', 0o640)
+        atomic_write('out.txt', 'new')
+        assert stat.S_IMODE(os.stat(workdir / 'out.txt').st_mode) == 0o640
+
+class TestAppendWrite:
+    def test_append_write(self, workdir):
+        append_write('out.txt', 'a\n')
+        append_write('out.txt', 'b\n')
+        assert (workdir / 'out.txt').read_text() == 'a\nb\n'
+
+    def test_append_write_does_not_rewrite_file(self, mocker, workdir):
+        append_write('out.txt', 'a\n')
+        mock_replace = mocker.patch('tetrika.task2.writers.os.replace')
+        append_write('out.txt', 'b\n')
+        mock_replace.assert_not_called()
+
+    def test_atomic_write_keeps_old_file_on_error(self, mocker, workdir):
+        atomic_write('out.txt', 'old')
+        mocker.patch('tetrika.task2.writers.os.replace', side_effect=OSError)
+
+        with pytest.raises(OSError):
+            atomic_write('out.txt', 'new')
+        assert [p.name for p in workdir.iterdir()] == ['out.txt']
+        assert (workdir / 'out.txt').read_text() == 'old'
+
+class TestWriters:
+    def test_csv_writer(self, workdir):
+        path = CSVWriter().write(DATA, run_at=RUN_AT)
+        assert path == '2026_01_01_10_30_00_result.csv'
+        assert (workdir / path).read_text(encoding='utf-8') == 'А,1\nБ,2\n'
+
+    def test_jsonl_writer(self, workdir):
+        path = JSONLinesWriter().write(DATA, run_at=RUN_AT)
+        assert path == '2026_01_01_10_30_00_result.jsonl'
+        assert (workdir / path).read_text(encoding='utf-8') == (
+            '{"letter": "А", "count": 1}\n{"letter": "Б", "count": 2}\n'
+        )
+
+    def test_timeseries_writer_appends_runs(self, workdir):
+        writer = TimeSeriesWriter()
+        writer.write(DATA, run_at=RUN_AT)
+        path = writer.write(Counter({'А': 3}), run_at=datetime(2026, 1, 1, 11, tzinfo=timezone.utc))
+
+        assert path == 'result_timeseries.csv'
+        assert (workdir / path).read_text(encoding='utf-8').splitlines() == [
+            '2026-01-01T10:30:00+00:00,А,1',
+            '2026-01-01T10:30:00+00:00,Б,2',
+            '2026-01-01T11:00:00+00:00,А,3'
+        ]
+
+    def test_timeseries_writer_defaults_to_utc(self, workdir):
+        path = TimeSeriesWriter().write(DATA)
+        timestamp = (workdir / path).read_text(encoding='utf-8').split(',')[0]
+        assert datetime.fromisoformat(timestamp).utcoffset().total_seconds() == 0
+
+    def test_writer_custom_alphabet(self, workdir):
+        path = CSVWriter('en.csv').write(DATA, 'ABCD', run_at=RUN_AT)
+        assert (workdir / path).read_text(encoding='utf-8') == 'D,5\n'
+
+    def test_result_writer_is_abstract(self):
+        with pytest.raises(TypeError):
+            ResultWriter()
+
+    def test_write_groups_with_labels(self, workdir):
+        path = TimeSeriesWriter().write_groups([({'category': 'Test'}, DATA, 'АБ')], run_at=RUN_AT)
+        assert (workdir / path).read_text(encoding='utf-8').splitlines() == [
+            '2026-01-01T10:30:00+00:00,Test,А,1',
+            '2026-01-01T10:30:00+00:00,Test,Б,2'
+        ]
+
+class TestGetWriter:
+    def test_get_writer(self):
+        assert isinstance(get_writer('timeseries'), TimeSeriesWriter)
+
+    def test_get_writer_unknown(self):
+        with pytest.raises(ValueError):
+            get_writer('parquet')
+
+    def test_writer_from_env_name_overrides_env(self, monkeypatch):
+        monkeypatch.setenv('TASK2_WRITER', 'csv')
+        assert isinstance(writer_from_env(name='jsonl'), JSONLinesWriter)
+        assert isinstance(writer_from_env(), CSVWriter)
+
+if __name__ == '__main__':
+    pytest.main()
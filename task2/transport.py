@@ -0,0 +1,201 @@
+import base64
+import gzip
+import json
+import os
+import time
+
+from contextlib import contextmanager
+
+import requests
+
+from requests.exceptions import HTTPError, RequestException
+
+from .constants import (
+    ARCHIVE_ENV,
+    LATENCY_ENV,
+    MODE_ENV,
+    MODE_RECORD,
+    MODE_REPLAY,
+
+    MISSING_ARCHIVE_TEXT,
+    REPLAY_MISS_TEXT,
+    WRONG_MODE_TEXT
+)
+
+class ReplayMissError(RequestException):
+    """Raised when replayed archive has no response for the requested URL."""
+
+class ReplayResponse:
+    """Minimal stand-in for `requests.Response` built from an archive entry."""
+
+    def __init__(self, url: str, status_code: int, content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HTTPError(f'{self.status_code} Error for url: {self.url}', response=self)
+
+class LiveTransport:
+    """Sends requests to the network as is.
+
+    :param session: Shared session to reuse connections, if any.
+    :type session: `requests.Session`, `None`
+    """
+
+    def __init__(self, session: requests.Session | None = None):
+        self.session = session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        if self.session is not None:
+            return self.session.get(url, **kwargs)
+        return requests.get(url, **kwargs)
+
+    def close(self) -> None:
+        pass
+
+class RecordingTransport(LiveTransport):
+    """Sends requests to the network and stores every request/response pair.
+    Pairs are written to a gzipped JSON lines archive on `close()`.
+
+    :param path: Archive file path.
+    :type path: `str`
+    :param session: Shared session to reuse connections, if any.
+    :type session: `requests.Session`, `None`
+    """
+
+    def __init__(self, path: str, session: requests.Session | None = None):
+        super().__init__(session)
+        self.path = path
+        self.entries = {}
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        response = super().get(url, **kwargs)
+        self.entries[url] = (response.status_code, response.content)
+        return response
+
+    def close(self) -> None:
+        save_archive(self.path, self.entries)
+
+class ReplayTransport:
+    """Serves responses from an archive written by `RecordingTransport`.
+
+    :param path: Archive file path.
+    :type path: `str`
+    :param latency: Simulated per-request latency, in seconds.
+    :type latency: `float`
+    """
+
+    def __init__(self, path: str, latency: float = 0.0):
+        self.entries = load_archive(path)
+        self.latency = latency
+
+    def get(self, url: str, **kwargs) -> ReplayResponse:
+        if self.latency:
+            time.sleep(self.latency)
+
+        if url not in self.entries:
+            raise ReplayMissError(REPLAY_MISS_TEXT.format(url=url))
+
+        status_code, content = self.entries[url]
+        return ReplayResponse(url, status_code, content)
+
+    def close(self) -> None:
+        pass
+
+def save_archive(path: str, entries: dict[str, tuple[int, bytes]]) -> None:
+    """Writes request/response pairs into a gzipped JSON lines file.
+    Bodies are stored as base64, so any bytes (not only UTF-8) round-trip exactly.
+
+    :param path: Archive file path.
+    :type path: `str`
+    :param entries: Mapping of URL to (status code, body) pairs.
+    :type entries: `dict`
+    """
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        for url, (status_code, content) in entries.items():
+            record = {'url': url, 'status': status_code, 'body': base64.b64encode(content).decode('ascii')}
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+
+def load_archive(path: str) -> dict[str, tuple[int, bytes]]:
+    """Reads request/response pairs from a gzipped JSON lines file.
+
+    :param path: Archive file path.
+    :type path: `str`
+    :return: Mapping of URL to (status code, body) pairs.
+    :rtype: `dict`
+    """
+    entries = {}
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            entries[record['url']] = (record['status'], base64.b64decode(record['body']))
+    return entries
+
+_transport = LiveTransport()
+
+def get(url: str, **kwargs):
+    """Sends a GET request through the active transport.
+
+    :param url: The URL where the GET request will be sent.
+    :type url: `str`
+    :return: `requests.Response` or a response-like object in replay mode.
+    """
+    return _transport.get(url, **kwargs)
+
+@contextmanager
+def use_transport(transport):
+    """Makes `transport` active for the duration of the block and closes it afterwards.
+
+    :param transport: `LiveTransport`, `RecordingTransport` or `ReplayTransport` instance.
+    """
+    global _transport
+    previous, _transport = _transport, transport
+    try:
+        yield transport
+    finally:
+        _transport = previous
+        transport.close()
+
+def transport_from_env(
+        session: requests.Session | None = None,
+        mode: str | None = None,
+        archive: str | None = None,
+        latency: float | None = None
+        ):
+    """Builds a transport from `TASK2_TRANSPORT`, `TASK2_ARCHIVE` and `TASK2_REPLAY_LATENCY`.
+    Passed arguments take precedence over the environment.
+
+    :param session: Shared session for live and record modes, if any.
+    :type session: `requests.Session`, `None`
+    :param mode: `record` or `replay`, `TASK2_TRANSPORT` if not passed.
+    :type mode: `str`, `None`
+    :param archive: Archive path, `TASK2_ARCHIVE` if not passed.
+    :type archive: `str`, `None`
+    :param latency: Simulated replay latency in seconds, `TASK2_REPLAY_LATENCY` if not passed.
+    :type latency: `float`, `None`
+    :return: Transport instance, live one if mode is not set.
+    :raises ValueError: If mode is unknown or archive path is not set.
+    """
+    mode = mode or os.environ.get(MODE_ENV)
+    if not mode:
+        return LiveTransport(session)
+
+    path = archive or os.environ.get(ARCHIVE_ENV)
+    if not path:
+        raise ValueError(MISSING_ARCHIVE_TEXT.format(mode=mode, env=ARCHIVE_ENV))
+    if mode == MODE_RECORD:
+        return RecordingTransport(path, session)
+    if mode == MODE_REPLAY:
+        if latency is None:
+            latency = float(os.environ.get(LATENCY_ENV, 0))
+        return ReplayTransport(path, latency)
+
+    raise ValueError(WRONG_MODE_TEXT.format(mode=mode))
@@ -0,0 +1,203 @@
+import csv
+import io
+import json
+import os
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from .constants import (
+    CSV_FILENAME,
+    DEFAULT_WRITER,
+    FILE_TIMESTAMP_FORMAT,
+    JSONL_FILENAME,
+    RU_ALPHABET,
+    TIMESERIES_FILENAME,
+    WRITER_ENV,
+
+    WRONG_WRITER_TEXT
+)
+
+# (метки группы, например {'base_url': ..., 'category': ...}, счетчик букв, алфавит)
+ResultGroup = tuple[dict[str, str], Counter[str, int], str]
+Row = tuple[dict[str, str], str, int]
+
+def atomic_write(path: str, text: str) -> None:
+    """Writes text to a temporary file next to `path` and renames it over `path`.
+    Readers see either the old file or the new one, never a partially written file.
+
+    :param path: Target file path.
+    :type path: `str`
+    :param text: Whole content to write.
+    :type text: `str`
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f'.{name}.{uuid4().hex}.tmp')
+    # права нового файла, как и у open(), задает ядро по umask процесса
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)  # существующий файл сохраняет свои права
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def append_write(path: str, text: str) -> None:
+    """Adds text to the end of `path` with a single `O_APPEND` write.
+    The cost does not depend on the file size, and concurrent runs do not overwrite each other.
+
+    :param path: Target file path, created if missing.
+    :type path: `str`
+    :param text: Content to add.
+    :type text: `str`
+    """
+    data = text.encode('utf-8')
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        written = os.write(fd, data)
+        while written < len(data):  # обычный файл пишется целиком, это на всякий случай
+            written += os.write(fd, data[written:])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class ResultWriter(ABC):
+    """Base writer of letter counts. Rows are buffered in memory and written in one go.
+
+    :param filename: Output file name, the writer default if not passed.
+    :type filename: `str`, `None`
+    """
+    default_filename = None
+    timestamped = True  # new file for each run, prefixed with its time
+    append = False
+
+    def __init__(self, filename: str | None = None):
+        self.filename = filename or self.default_filename
+
+    def get_path(self, run_at: datetime) -> str:
+        if self.timestamped:
+            return '_'.join((run_at.strftime(FILE_TIMESTAMP_FORMAT), self.filename))
+        return self.filename
+
+    @abstractmethod
+    def format_rows(self, rows: list[Row], run_at: datetime) -> str:
+        """Formats (labels, letter, count) rows as the file content."""
+
+    def write(self, data: Counter[str, int], alphabet: str = RU_ALPHABET, run_at: datetime | None = None) -> str:
+        """Writes letters with non-zero counts in alphabetical order.
+
+        :param data: Counter object where keys are unique characters and values are their counts.
+        :type data: `Counter`
+        :param alphabet: Letters order of the rows.
+        :type alphabet: `str`
+        :param run_at: Time of the run. Current UTC time if not passed.
+        :type run_at: `datetime`, `None`
+        :return: Written file path.
+        :rtype: `str`
+        """
+        return self.write_groups([({}, data, alphabet)], run_at)
+
+    def write_groups(self, groups: Iterable[ResultGroup], run_at: datetime | None = None) -> str:
+        """Writes several counters into one file, each row prefixed with its group labels.
+
+        :param groups: (labels, counter, alphabet) triples.
+        :type groups: `Iterable`
+        :param run_at: Time of the run. Current UTC time if not passed.
+        :type run_at: `datetime`, `None`
+        :return: Written file path.
+        :rtype: `str`
+        """
+        run_at = run_at or datetime.now(timezone.utc)
+        rows = [
+            (labels, char, count)
+            for labels, data, alphabet in groups
+            for char in alphabet
+            if (count := data.get(char))
+        ]
+        path = self.get_path(run_at)
+        text = self.format_rows(rows, run_at)
+        if self.append:
+            append_write(path, text)
+        else:
+            atomic_write(path, text)
+        return path
+
+class CSVWriter(ResultWriter):
+    """`[labels...,]letter,count` rows, new timestamped file for each run."""
+    default_filename = CSV_FILENAME
+
+    def format_rows(self, rows: list[Row], run_at: datetime) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator='\n').writerows(
+            (*labels.values(), char, count) for labels, char, count in rows
+        )
+        return buffer.getvalue()
+
+class JSONLinesWriter(ResultWriter):
+    """`{[labels...,] "letter": str, "count": int}` lines, new timestamped file for each run."""
+    default_filename = JSONL_FILENAME
+
+    def format_rows(self, rows: list[Row], run_at: datetime) -> str:
+        return ''.join(
+            json.dumps({**labels, 'letter': char, 'count': count}, ensure_ascii=False) + '\n'
+            for labels, char, count in rows
+        )
+
+class TimeSeriesWriter(ResultWriter):
+    """`run_at,[labels...,]letter,count` rows appended to one growing file.
+    `run_at` is written in UTC with its offset, like the delta state timestamps."""
+    default_filename = TIMESERIES_FILENAME
+    timestamped = False
+    append = True
+
+    def format_rows(self, rows: list[Row], run_at: datetime) -> str:
+        timestamp = run_at.astimezone(timezone.utc).isoformat(timespec='seconds')  # naive время считается локальным
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator='\n').writerows(
+            (timestamp, *labels.values(), char, count) for labels, char, count in rows
+        )
+        return buffer.getvalue()
+
+WRITERS = {
+    'csv': CSVWriter,
+    'jsonl': JSONLinesWriter,
+    'timeseries': TimeSeriesWriter
+}
+
+def get_writer(name: str = DEFAULT_WRITER, filename: str | None = None) -> ResultWriter:
+    """Creates a writer by its name.
+
+    :param name: One of `WRITERS` keys.
+    :type name: `str`
+    :param filename: Output file name, the writer default if not passed.
+    :type filename: `str`, `None`
+    :rtype: `ResultWriter`
+    :raises ValueError: If writer name is unknown.
+    """
+    if name not in WRITERS:
+        raise ValueError(WRONG_WRITER_TEXT.format(name=name, expected=', '.join(WRITERS)))
+    return WRITERS[name](filename)
+
+def writer_from_env(filename_prefix: str = '', name: str | None = None) -> ResultWriter:
+    """Creates a writer named by `TASK2_WRITER`, CSV one if not set.
+
+    :param filename_prefix: Added to the writer default file name, e.g. `batch_`.
+    :type filename_prefix: `str`
+    :param name: Writer name, takes precedence over `TASK2_WRITER`.
+    :type name: `str`, `None`
+    :rtype: `ResultWriter`
+    """
+    name = name or os.environ.get(WRITER_ENV) or DEFAULT_WRITER
+    writer = get_writer(name)
+    writer.filename = filename_prefix + writer.filename
+    return writer
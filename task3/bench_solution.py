@@ -0,0 +1,81 @@
+import argparse
+import random
+
+from collections import defaultdict
+from time import perf_counter
+
+from .solution import aggregate_appearance, appearance, validate_records
+
+LESSON_DURATION = 3600
+POOL_SIZE = 10_000  # разных уроков, дальше они повторяются с другими id
+TUTORS = 1_000
+PUPILS = 20_000
+
+def generate_person_intervals(rng: random.Random, lesson_start: int, count: int) -> list[int]:
+    # как в TESTS: вход может быть до начала урока, выход - после конца
+    points = sorted(
+        rng.randint(lesson_start - 300, lesson_start + LESSON_DURATION + 300) for _ in range(count * 2)
+    )
+    return points
+
+def generate_intervals(rng: random.Random) -> dict[str, list[int]]:
+    lesson_start = rng.randint(1594600000, 1594700000)
+    return {
+        'lesson': [lesson_start, lesson_start + LESSON_DURATION],
+        'pupil': generate_person_intervals(rng, lesson_start, rng.randint(1, 14)),
+        'tutor': generate_person_intervals(rng, lesson_start, rng.randint(1, 3))
+    }
+
+def generate_records(lessons: int, seed: int = 31):
+    rng = random.Random(seed)
+    pool = [generate_intervals(rng) for _ in range(min(lessons, POOL_SIZE))]
+    for lesson_id in range(lessons):
+        key = (lesson_id, lesson_id % TUTORS, lesson_id % PUPILS)
+        yield key, pool[lesson_id % len(pool)]
+
+def group_by_appearance(records) -> tuple[dict[int, int], dict[int, int]]:
+    # прежний способ: appearance на каждый урок и группировка на стороне Python
+    tutor_totals = defaultdict(int)
+    pupil_totals = defaultdict(int)
+    for (_, tutor_id, pupil_id), intervals in records:
+        total = appearance(intervals)
+        tutor_totals[tutor_id] += total
+        pupil_totals[pupil_id] += total
+    return dict(tutor_totals), dict(pupil_totals)
+
+def timed(func, *args, **kwargs) -> tuple[float, object]:
+    started = perf_counter()
+    result = func(*args, **kwargs)
+    return perf_counter() - started, result
+
+def run(lessons: int) -> dict[str, float]:
+    per_lesson_s, expected = timed(group_by_appearance, generate_records(lessons))
+    trusted_s, result = timed(aggregate_appearance, generate_records(lessons), trusted=True)
+    assert (result.tutor, result.pupil) == expected
+
+    validated_s, result = timed(aggregate_appearance, generate_records(lessons))
+    assert (result.tutor, result.pupil) == expected and not result.errors
+
+    validate_only_s, _ = timed(validate_records, generate_records(lessons))
+    return {
+        'per_lesson_s': per_lesson_s,
+        'aggregate_s': trusted_s,
+        'aggregate_validated_s': validated_s,
+        'validate_only_s': validate_only_s
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-lesson appearance vs aggregate_appearance')
+    parser.add_argument('--lessons', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    result = run(args.lessons)
+    base = result['per_lesson_s']
+    print(f'lessons:               {args.lessons}')
+    print(f'appearance+groupby:    {base:.2f} s')
+    print(f'aggregate (trusted):   {result["aggregate_s"]:.2f} s ({result["aggregate_s"] / base:.1%})')
+    print(f'aggregate (validated): {result["aggregate_validated_s"]:.2f} s ({result["aggregate_validated_s"] / base:.1%})')
+    print(f'validate_records:      {result["validate_only_s"]:.2f} s ({result["validate_only_s"] / base:.1%})')
+
+if __name__ == '__main__':
+    main()
@@ -24,3 +24,12 @@ TESTS = [
         'answer': 3565                                                 # время общего присутствия ученика и учителя на уроке (в секундах)
     },
 ]
+
+NOT_DICT_TEXT = 'Intervals must be a dict, got \'{actual}\''
+NOT_LIST_TEXT = 'Value of \'{key}\' must be a list, got \'{actual}\''
+NOT_INT_TEXT = 'Value of \'{key}\' must contain only int timestamps'
+MISSING_KEY_TEXT = 'Key \'{key}\' is missing'
+LESSON_BOUNDS_TEXT = 'Lesson must be [start, end] with start < end, got {lesson}'
+ODD_LENGTH_TEXT = 'Intervals of \'{person}\' must have even length, got {length}'
+REVERSED_PAIR_TEXT = 'Interval {index} of \'{person}\' ends before it starts: [{start}, {end}]'
+BUCKET_WIDTH_TEXT = 'Bucket width must be positive, got {bucket_width}'
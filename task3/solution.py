@@ -1,49 +1,211 @@
-from .constants import TESTS
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable
+from operator import le
+from typing import NamedTuple
+
+from .constants import (
+    TESTS,
+
+    BUCKET_WIDTH_TEXT,
+    LESSON_BOUNDS_TEXT,
+    MISSING_KEY_TEXT,
+    NOT_DICT_TEXT,
+    NOT_INT_TEXT,
+    NOT_LIST_TEXT,
+    ODD_LENGTH_TEXT,
+    REVERSED_PAIR_TEXT
+)
+
+LessonKey = tuple[int, int, int]  # (lesson_id, tutor_id, pupil_id)
+
+class RecordError(NamedTuple):
+    key: LessonKey
+    errors: list[str]
+
+class AppearanceTotals(NamedTuple):
+    tutor: dict[int, int]  # tutor_id: время совместного присутствия по всем урокам
+    pupil: dict[int, int]  # pupil_id: то же для ученика
+    errors: list[RecordError]  # отброшенные записи, пусто при trusted=True
+
+class PresenceTimeline(NamedTuple):
+    total: int
+    segments: array | None  # [начало, конец, начало, конец, ...] отрезков совместного присутствия
+    histogram: list[int] | None  # секунды совместного присутствия в каждом интервале bucket_width от начала урока
 
 def get_person_events(
         person_intervals: list[int],
         tag: str,
         lesson_start: int,
-        lesson_end: int
+        lesson_end: int,
+        events: list[tuple[int, int, str]] | None = None
         ) -> list[tuple[int, int, str]]:
-    events = []
+    # Интервалы обрезаются по границам урока. Если передан events, события дописываются в него
+    # (aggregate_appearance переиспользует один список для всех уроков)
+    if events is None:
+        events = []
+    append = events.append
     for i in range(0, len(person_intervals), 2):
-        start = max(person_intervals[i], lesson_start)
-        end = min(person_intervals[i+1], lesson_end)
+        start = person_intervals[i]
+        end = person_intervals[i+1]
+        if start < lesson_start:
+            start = lesson_start
+        if end > lesson_end:
+            end = lesson_end
         if start < end:
-            events.append((start, 1, tag))
-            events.append((end, -1, tag))
+            append((start, 1, tag))
+            append((end, -1, tag))
     return events
 
-def appearance(intervals: dict[str, list[int]]) -> int:
-    start_lesson, end_lesson = intervals['lesson']
-
-    pupil = get_person_events(intervals['pupil'], 'P', start_lesson, end_lesson)
-    tutor = get_person_events(intervals['tutor'], 'T', start_lesson, end_lesson)
-
-    events = []
-    events.extend(pupil)
-    events.extend(tutor)
-    events.sort()
+def add_to_buckets(histogram: list[int], start: int, end: int, bucket_width: int) -> None:
+    # start и end отсчитываются от начала урока
+    while start < end:
+        bucket = start // bucket_width
+        bucket_end = min((bucket + 1) * bucket_width, end)
+        histogram[bucket] += bucket_end - start
+        start = bucket_end
 
+def sweep_presence(
+        events: list[tuple[int, int, str]],
+        lesson_start: int = 0,
+        segments: array | None = None,
+        histogram: list[int] | None = None,
+        bucket_width: int = 0
+        ) -> int:
+    # Единственный проход по отсортированным событиям (теги 'P' и 'T').
+    # Возвращает сумму; если переданы segments и/или histogram, в том же проходе заполняет и их
     total = 0
     p_count = 0
     t_count = 0
-    prev_time = None
+    prev_time = 0
 
     for time, event, person in events:
-        if p_count > 0 and t_count > 0 and prev_time is not None:
+        if p_count and t_count and time > prev_time:
             total += time - prev_time
+            if segments is not None:
+                if segments and segments[-1] == prev_time:  # склеиваем соседние отрезки
+                    segments[-1] = time
+                else:
+                    segments.append(prev_time)
+                    segments.append(time)
+            if histogram is not None:
+                add_to_buckets(histogram, prev_time - lesson_start, time - lesson_start, bucket_width)
 
-        if person == 'P':
-            p_count += event
         if person == 'T':
             t_count += event
+        else:
+            p_count += event
 
         prev_time = time
 
     return total
 
+def get_lesson_events(intervals: dict[str, list[int]]) -> list[tuple[int, int, str]]:
+    start_lesson, end_lesson = intervals['lesson']
+
+    events = get_person_events(intervals['pupil'], 'P', start_lesson, end_lesson)
+    events.extend(get_person_events(intervals['tutor'], 'T', start_lesson, end_lesson))
+    events.sort()
+    return events
+
+def appearance(intervals: dict[str, list[int]]) -> int:
+    return sweep_presence(get_lesson_events(intervals))
+
+def appearance_timeline(
+        intervals: dict[str, list[int]],
+        segments: bool = True,
+        bucket_width: int | None = None
+        ) -> PresenceTimeline:
+    # Тот же проход, что и в appearance, но кроме суммы собирает отрезки и/или гистограмму
+    if bucket_width is not None and bucket_width <= 0:
+        raise ValueError(BUCKET_WIDTH_TEXT.format(bucket_width=bucket_width))
+
+    start_lesson, end_lesson = intervals['lesson']
+    flat = array('q') if segments else None
+    histogram = [0] * -(-(end_lesson - start_lesson) // bucket_width) if bucket_width else None
+
+    total = sweep_presence(get_lesson_events(intervals), start_lesson, flat, histogram, bucket_width or 0)
+    return PresenceTimeline(total, flat, histogram)
+
+def check_intervals(intervals: dict[str, list[int]]) -> list[str]:
+    # Сначала тип и форма записи, чтобы дальнейшие проверки не падали на мусоре
+    if not isinstance(intervals, dict):
+        return [NOT_DICT_TEXT.format(actual=type(intervals).__name__)]
+
+    errors = []
+    for key in ('lesson', 'pupil', 'tutor'):
+        if key not in intervals:
+            errors.append(MISSING_KEY_TEXT.format(key=key))
+        elif not isinstance(intervals[key], list):
+            errors.append(NOT_LIST_TEXT.format(key=key, actual=type(intervals[key]).__name__))
+        elif not set(map(type, intervals[key])) <= {int}:
+            errors.append(NOT_INT_TEXT.format(key=key))
+    if errors:
+        return errors
+
+    lesson = intervals['lesson']
+    if len(lesson) != 2 or not lesson[0] < lesson[1]:
+        errors.append(LESSON_BOUNDS_TEXT.format(lesson=lesson))
+
+    for person in ('pupil', 'tutor'):
+        person_intervals = intervals[person]
+        if len(person_intervals) % 2:
+            errors.append(ODD_LENGTH_TEXT.format(person=person, length=len(person_intervals)))
+        starts, ends = person_intervals[::2], person_intervals[1::2]
+        if all(map(le, starts, ends)):  # быстрая проверка, подробности ищем только при ошибке
+            continue
+        for index, (start, end) in enumerate(zip(starts, ends)):
+            if end < start:
+                errors.append(REVERSED_PAIR_TEXT.format(person=person, index=index, start=start, end=end))
+
+    return errors
+
+def validate_records(
+        records: Iterable[tuple[LessonKey, dict[str, list[int]]]]
+        ) -> tuple[list[tuple[LessonKey, dict[str, list[int]]]], list[RecordError]]:
+    # Отдельная проверка батча без подсчета; aggregate_appearance проверяет записи сама, по ходу прохода.
+    # Плохие записи не роняют весь батч: они отбрасываются и возвращаются вместе с причинами
+    valid = []
+    rejected = []
+    for key, intervals in records:
+        if errors := check_intervals(intervals):
+            rejected.append(RecordError(key, errors))
+        else:
+            valid.append((key, intervals))
+    return valid, rejected
+
+def aggregate_appearance(
+        records: Iterable[tuple[LessonKey, dict[str, list[int]]]],
+        trusted: bool = False
+        ) -> AppearanceTotals:
+    # Каждая запись проверяется в том же проходе, плохие пропускаются и попадают в errors.
+    # trusted=True пропускает проверку входных данных (быстрый путь для заведомо чистых данных)
+    rejected = []
+
+    # Один проход по всем урокам: события каждого урока сортируются один раз,
+    # а список events переиспользуется между уроками вместо создания нового
+    tutor_totals = defaultdict(int)
+    pupil_totals = defaultdict(int)
+    events = []
+
+    for key, intervals in records:
+        if not trusted and (errors := check_intervals(intervals)):
+            rejected.append(RecordError(key, errors))
+            continue
+
+        _, tutor_id, pupil_id = key
+        lesson_start, lesson_end = intervals['lesson']
+        events.clear()
+        get_person_events(intervals['pupil'], 'P', lesson_start, lesson_end, events)
+        get_person_events(intervals['tutor'], 'T', lesson_start, lesson_end, events)
+        events.sort()
+        total = sweep_presence(events)
+
+        tutor_totals[tutor_id] += total
+        pupil_totals[pupil_id] += total
+
+    return AppearanceTotals(dict(tutor_totals), dict(pupil_totals), rejected)
+
 if __name__ == '__main__':
     for i, test in enumerate(TESTS):
         appearance(test['intervals'])
@@ -1,6 +1,14 @@
 import pytest
 
-from ..task3.solution import get_person_events, appearance
+from ..task3.constants import TESTS
+from ..task3.solution import (
+    get_person_events,
+    appearance,
+    appearance_timeline,
+    aggregate_appearance,
+    check_intervals,
+    validate_records
+)
 
 class TestGetPersonEvents:
     def test_get_person_events_basic(self):
@@ -18,6 +26,12 @@ class TestGetPersonEvents:
         result = get_person_events(intervals, 'T', 10, 40)
         assert result == [(10, 1, 'T'), (25, -1, 'T'), (35, 1, 'T'), (40, -1, 'T')]
 
+    def test_get_person_events_appends_to_events(self):
+        events = [(10, 1, 'P')]
+        result = get_person_events([5, 25], 'T', 10, 40, events)
+        assert result is events
+        assert events == [(10, 1, 'P'), (10, 1, 'T'), (25, -1, 'T')]
+
 class TestAppearance:
     def test_appearance_simple_overlap(self):
         intervals = {
@@ -59,5 +73,133 @@ class TestAppearance:
         }
         assert appearance(intervals) == 13
 
+class TestAppearanceTimeline:
+    def test_appearance_timeline_segments(self):
+        intervals = {
+            'lesson': [10, 50],
+            'pupil':  [5,  15, 20, 30, 35, 45],
+            'tutor':  [12, 18, 25, 40]
+        }
+        result = appearance_timeline(intervals)
+        assert result.total == 13
+        assert list(result.segments) == [12, 15, 25, 30, 35, 40]
+        assert result.histogram is None
+
+    def test_appearance_timeline_merges_adjacent_segments(self):
+        intervals = {
+            'lesson': [0, 100],
+            'pupil':  [10, 20, 20, 30],
+            'tutor':  [0, 100]
+        }
+        assert list(appearance_timeline(intervals).segments) == [10, 30]
+
+    def test_appearance_timeline_histogram(self):
+        intervals = {
+            'lesson': [100, 350],
+            'pupil':  [90, 220],
+            'tutor':  [150, 400]
+        }
+        result = appearance_timeline(intervals, segments=False, bucket_width=60)
+        assert result.segments is None
+        assert result.histogram == [10, 60, 0, 0, 0]
+        assert sum(result.histogram) == result.total == 70
+
+    @pytest.mark.parametrize('bucket_width', [0, -60])
+    def test_appearance_timeline_wrong_bucket_width(self, bucket_width):
+        intervals = {'lesson': [0, 100], 'pupil': [0, 100], 'tutor': [0, 100]}
+        with pytest.raises(ValueError):
+            appearance_timeline(intervals, bucket_width=bucket_width)
+
+    def test_appearance_timeline_matches_appearance(self):
+        for test in TESTS:
+            result = appearance_timeline(test['intervals'], bucket_width=60)
+            assert result.total == test['answer']
+            assert sum(result.histogram) == test['answer']
+            assert sum(result.segments[1::2]) - sum(result.segments[::2]) == test['answer']
+
+class TestAggregateAppearance:
+    def test_aggregate_appearance_groups_totals(self):
+        records = [
+            ((1, 10, 100), TESTS[0]['intervals']),
+            ((2, 10, 200), TESTS[1]['intervals']),
+            ((3, 20, 100), TESTS[2]['intervals'])
+        ]
+        result = aggregate_appearance(records)
+        assert result.tutor == {10: 3117 + 3577, 20: 3565}
+        assert result.pupil == {100: 3117 + 3565, 200: 3577}
+
+    def test_aggregate_appearance_matches_appearance(self):
+        records = (((i, i, i), test['intervals']) for i, test in enumerate(TESTS))
+        result = aggregate_appearance(records)
+        assert result.pupil == {i: test['answer'] for i, test in enumerate(TESTS)}
+
+    def test_aggregate_appearance_empty(self):
+        result = aggregate_appearance([])
+        assert result.tutor == {}
+        assert result.pupil == {}
+
+class TestCheckIntervals:
+    def test_check_intervals_valid(self):
+        for test in TESTS:
+            assert check_intervals(test['intervals']) == []
+
+    def test_check_intervals_odd_length(self):
+        intervals = {'lesson': [10, 20], 'pupil': [10, 15, 16], 'tutor': []}
+        assert check_intervals(intervals) == ["Intervals of 'pupil' must have even length, got 3"]
+
+    def test_check_intervals_reversed_pair(self):
+        intervals = {'lesson': [10, 20], 'pupil': [10, 15], 'tutor': [12, 14, 18, 16]}
+        assert check_intervals(intervals) == ["Interval 1 of 'tutor' ends before it starts: [18, 16]"]
+
+    def test_check_intervals_lesson_bounds(self):
+        intervals = {'lesson': [20, 10], 'pupil': [], 'tutor': []}
+        assert check_intervals(intervals) == ['Lesson must be [start, end] with start < end, got [20, 10]']
+
+    def test_check_intervals_missing_key(self):
+        assert check_intervals({'lesson': [10, 20], 'pupil': []}) == ["Key 'tutor' is missing"]
+
+    @pytest.mark.parametrize(
+        'intervals,expected',
+        [
+            (None, ["Intervals must be a dict, got 'NoneType'"]),
+            ({'lesson': None, 'pupil': [], 'tutor': []}, ["Value of 'lesson' must be a list, got 'NoneType'"]),
+            ({'lesson': [10, 20], 'pupil': None, 'tutor': []}, ["Value of 'pupil' must be a list, got 'NoneType'"]),
+            ({'lesson': [10, 20], 'pupil': [1, 'x'], 'tutor': []}, ["Value of 'pupil' must contain only int timestamps"])
+        ]
+    )
+    def test_check_intervals_wrong_types(self, intervals, expected):
+        assert check_intervals(intervals) == expected
+
+class TestValidateRecords:
+    def test_validate_records_rejects_only_bad_records(self):
+        bad = {'lesson': [10, 20], 'pupil': [10], 'tutor': [10, 20]}
+        valid, rejected = validate_records([((1, 1, 1), TESTS[0]['intervals']), ((2, 1, 1), bad)])
+
+        assert valid == [((1, 1, 1), TESTS[0]['intervals'])]
+        assert [error.key for error in rejected] == [(2, 1, 1)]
+
+    def test_aggregate_appearance_skips_bad_records(self):
+        bad = {'lesson': [10, 20], 'pupil': [10], 'tutor': [10, 20]}
+        result = aggregate_appearance([((1, 10, 100), TESTS[0]['intervals']), ((2, 10, 100), bad)])
+
+        assert result.tutor == {10: 3117}
+        assert [error.key for error in result.errors] == [(2, 10, 100)]
+
+    def test_aggregate_appearance_skips_malformed_records(self):
+        records = [
+            ((1, 10, 100), None),
+            ((2, 10, 100), {'lesson': [10, 20], 'pupil': [1, 'x'], 'tutor': None}),
+            ((3, 10, 100), TESTS[0]['intervals'])
+        ]
+        result = aggregate_appearance(iter(records))
+
+        assert result.tutor == {10: 3117}
+        assert [error.key for error in result.errors] == [(1, 10, 100), (2, 10, 100)]
+
+    def test_aggregate_appearance_trusted_skips_validation(self):
+        result = aggregate_appearance([((1, 10, 100), TESTS[0]['intervals'])], trusted=True)
+        assert result.tutor == {10: 3117}
+        assert result.errors == []
+
 if __name__ == '__main__':
     pytest.main()